@@ -9,6 +9,7 @@ import logging
 import re
 import subprocess
 from dataclasses import asdict, dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import yaml
@@ -41,6 +42,25 @@ REFERENCE_DOC_PATTERNS = (
 )
 
 
+_BACKREFERENCE = re.compile(r"\\[1-9]")
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Fold a pattern tuple into one case-insensitive alternation.
+
+    Returns None when the patterns cannot be safely combined (empty tuple,
+    numbered backreferences, clashing group names); callers then search
+    one by one.
+    """
+    if not patterns or any(_BACKREFERENCE.search(pattern) for pattern in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    except re.error:
+        return None
+
+
 @dataclass
 class DriftReport:
     status: str
@@ -57,6 +77,9 @@ def _changed_files(base_ref: str, head_ref: str) -> list[str]:
 
 
 def _select(files: list[str], patterns: tuple[str, ...]) -> list[str]:
+    combined = _compile_patterns(patterns)
+    if combined is not None:
+        return [path for path in files if combined.search(path)]
     return [path for path in files if any(re.search(pattern, path, re.IGNORECASE) for pattern in patterns)]
 
 
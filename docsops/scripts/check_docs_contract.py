@@ -8,6 +8,7 @@ import hashlib
 import json
 import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -33,6 +34,25 @@ DOC_PATTERNS = (
 )
 
 
+_BACKREFERENCE = re.compile(r"\\[1-9]")
+
+
+@lru_cache(maxsize=32)
+def _compile_patterns(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Fold a pattern tuple into one case-insensitive alternation.
+
+    Returns None when the patterns cannot be safely combined (empty tuple,
+    numbered backreferences, clashing group names); callers then search
+    one by one.
+    """
+    if not patterns or any(_BACKREFERENCE.search(pattern) for pattern in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    except re.error:
+        return None
+
+
 def _changed_files(base_ref: str, head_ref: str) -> list[str]:
     cmd = ["git", "diff", "--name-only", f"{base_ref}...{head_ref}"]
     result = subprocess.run(cmd, capture_output=True, text=True, check=True)
@@ -41,6 +61,9 @@ def _changed_files(base_ref: str, head_ref: str) -> list[str]:
 
 
 def _matches_any(path: str, patterns: tuple[str, ...]) -> bool:
+    combined = _compile_patterns(patterns)
+    if combined is not None:
+        return combined.search(path) is not None
     return any(re.search(pattern, path, re.IGNORECASE) for pattern in patterns)
 
 
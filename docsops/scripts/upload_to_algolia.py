@@ -6,12 +6,18 @@ works with any Python 3.8+ installation.
 """
 
 import argparse
-import json
 import os
 import sys
 import urllib.request
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from scripts import fast_json
+except ImportError:
+    import fast_json  # type: ignore[no-redef]
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Upload records to Algolia")
@@ -40,19 +46,44 @@ def parse_args() -> argparse.Namespace:
         default="docs",
         help="Fallback index name if env variable is not set",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1000,
+        help="Records per batch request",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of batch requests sent in parallel",
+    )
+    parser.add_argument(
+        "--no-clear",
+        dest="clear",
+        action="store_false",
+        help="Keep existing records instead of clearing the index first "
+        "(records are replaced by objectID; removed pages are not deleted)",
+    )
     return parser.parse_args()
 
 
 def _algolia_request(app_id: str, api_key: str, method: str, path: str, body=None):
-    """Send a request to the Algolia REST API."""
+    """Send a request to the Algolia REST API.
+
+    *body* may be a JSON-serializable object or already-encoded bytes.
+    """
     url = f"https://{app_id}-dsn.algolia.net{path}"
-    data = json.dumps(body).encode("utf-8") if body else None
+    if isinstance(body, bytes):
+        data = body
+    else:
+        data = fast_json.dumps(body) if body else None
     req = urllib.request.Request(url, data=data, method=method)
     req.add_header("X-Algolia-Application-Id", app_id)
     req.add_header("X-Algolia-API-Key", api_key)
     req.add_header("Content-Type", "application/json")
     with urllib.request.urlopen(req, timeout=30) as resp:
-        return json.loads(resp.read())
+        return fast_json.loads(resp.read())
 
 
 def main():
@@ -72,8 +103,7 @@ def main():
         print(f"No Algolia records file found: {records_file}")
         return 0
 
-    with records_file.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = fast_json.loads(records_file.read_bytes())
 
     if isinstance(data, dict):
         records = data.get("records", [])
@@ -97,21 +127,39 @@ def main():
         print(f"Index settings updated (taskID={result.get('taskID')})")
 
     # Clear existing records
-    result = _algolia_request(app_id, api_key, "POST", f"{base}/clear", {})
-    print(f"Index cleared (taskID={result.get('taskID')})")
+    if args.clear:
+        result = _algolia_request(app_id, api_key, "POST", f"{base}/clear", {})
+        print(f"Index cleared (taskID={result.get('taskID')})")
+
+    # Upload records in batches; bodies are encoded up front so worker
+    # threads only wait on the network.
+    batch_size = max(args.batch_size, 1)
+    batches = [records[i : i + batch_size] for i in range(0, len(records), batch_size)]
+    bodies = [
+        fast_json.dumps({"requests": [{"action": "addObject", "body": r} for r in batch]})
+        for batch in batches
+    ]
+
+    def send(body: bytes) -> dict:
+        return _algolia_request(app_id, api_key, "POST", f"{base}/batch", body)
+
+    def report(number: int, batch: list, future: Future) -> int:
+        result = future.result()
+        print(f"Batch {number}: {len(batch)} records (taskID={result.get('taskID')})")
+        return len(batch)
 
-    # Upload records in batches
-    batch_size = 1000
     total = 0
-    for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
-        body = {"requests": [{"action": "addObject", "body": r} for r in batch]}
-        result = _algolia_request(app_id, api_key, "POST", f"{base}/batch", body)
-        total += len(batch)
-        print(
-            f"Batch {i // batch_size + 1}: "
-            f"{len(batch)} records (taskID={result.get('taskID')})"
-        )
+    workers = max(args.concurrency, 1)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Only `workers` batches are in flight at a time, so a failed batch
+        # stops the upload instead of every remaining batch still going out.
+        in_flight: deque = deque()
+        for number, (batch, body) in enumerate(zip(batches, bodies), start=1):
+            in_flight.append((number, batch, executor.submit(send, body)))
+            if len(in_flight) >= workers:
+                total += report(*in_flight.popleft())
+        while in_flight:
+            total += report(*in_flight.popleft())
 
     print(f"Uploaded {total} records to Algolia index '{index_name}'")
     return 0
@@ -1,25 +1,136 @@
 #!/usr/bin/env python3
-"""Validate Markdown frontmatter against docs-schema.yml."""
+"""Validate Markdown frontmatter against docs-schema.yml.
+
+Per-file results are cached in .cache/frontmatter.json; set
+FRONTMATTER_CACHE=0 to skip the cache. It is also skipped under
+pre-commit so client repos are not left with an untracked file.
+"""
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, NamedTuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+_ISO_DATE_RE = re.compile(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$")
+_LOCALE_DIR_RE = re.compile(r"^[a-z]{2,3}$")
+
+# Frontmatter is read in blocks of this size until the closing delimiter.
+_FRONTMATTER_READ_CHUNK = 4096
+
+# Below this many files per worker, process start-up costs more than it saves.
+_FILES_PER_WORKER = 16
+
+# Per-file results keyed by (mtime, size), invalidated when the schema or
+# this script changes.
+_VALIDATION_CACHE_PATH = Path(".cache/frontmatter.json")
+
+
+class CompiledRule(NamedTuple):
+    """Schema node with its keywords extracted and validated once."""
+
+    type_checks: tuple[Callable[[Any], bool], ...] | None
+    type_label: str
+    enum: frozenset[Any] | tuple[Any, ...] | None
+    enum_label: str
+    min_length: int | None
+    max_length: int | None
+    pattern: str | None
+    pattern_re: re.Pattern[str] | None
+    min_items: int | None
+    max_items: int | None
+    unique_items: bool
+    items: CompiledRule | None
+    required: tuple[str, ...]
+    required_set: frozenset[str]
+    properties: tuple[tuple[str, CompiledRule], ...]
+
 
 def load_schema(schema_path: str = "docs-schema.yml") -> dict[str, Any]:
     """Load JSON Schema (YAML format) used for frontmatter validation."""
-    schema = yaml.safe_load(Path(schema_path).read_text(encoding="utf-8"))
+    schema = yaml.load(Path(schema_path).read_bytes(), Loader=_YamlLoader)
     if not isinstance(schema, dict):
         raise ValueError("Schema must be a mapping.")
     return schema
 
 
+def _int_or_none(value: Any) -> int | None:
+    return value if isinstance(value, int) else None
+
+
+def _compile_rule(schema: dict[str, Any]) -> CompiledRule:
+    """Pre-index a schema node so validation does no per-value dict lookups."""
+    expected_type = schema.get("type")
+    type_checks: tuple[Callable[[Any], bool], ...] | None = None
+    if isinstance(expected_type, str):
+        type_checks = (_TYPE_CHECKS.get(expected_type, _accept_any),)
+    elif isinstance(expected_type, list):
+        # Non-string entries never match, as in _type_matches.
+        type_checks = tuple(
+            _TYPE_CHECKS.get(item, _accept_any) for item in expected_type if isinstance(item, str)
+        )
+
+    enum: frozenset[Any] | tuple[Any, ...] | None = None
+    if "enum" in schema:
+        try:
+            enum = frozenset(schema["enum"])
+        except TypeError:
+            enum = tuple(schema["enum"])
+
+    pattern = schema.get("pattern")
+    if not isinstance(pattern, str):
+        pattern = None
+    item_schema = schema.get("items")
+    required = schema.get("required", [])
+    if not isinstance(required, list):
+        required = []
+    properties = schema.get("properties", {})
+
+    return CompiledRule(
+        type_checks=type_checks,
+        type_label=str(schema.get("type")),
+        enum=enum,
+        enum_label=str(schema.get("enum")),
+        min_length=_int_or_none(schema.get("minLength")),
+        max_length=_int_or_none(schema.get("maxLength")),
+        pattern=pattern,
+        pattern_re=re.compile(pattern) if pattern is not None else None,
+        min_items=_int_or_none(schema.get("minItems")),
+        max_items=_int_or_none(schema.get("maxItems")),
+        unique_items=schema.get("uniqueItems") is True,
+        items=_compile_rule(item_schema) if isinstance(item_schema, dict) else None,
+        required=tuple(required),
+        required_set=frozenset(required),
+        properties=tuple(
+            (field, _compile_rule(field_schema))
+            for field, field_schema in properties.items()
+            if isinstance(field_schema, dict)
+        )
+        if isinstance(properties, dict)
+        else (),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _compiled_schema(schema_path: str = "docs-schema.yml") -> CompiledRule:
+    """Load and compile the docs schema once per process."""
+    return _compile_rule(load_schema(schema_path))
+
+
 def extract_frontmatter(text: str) -> dict[str, Any] | None:
     """Extract frontmatter mapping from Markdown content."""
     if not text.startswith("---"):
@@ -27,13 +138,47 @@ def extract_frontmatter(text: str) -> dict[str, Any] | None:
     parts = text.split("---", 2)
     if len(parts) < 3:
         return None
+    return _load_mapping(parts[1])
+
+
+def _load_mapping(raw: str | bytes) -> dict[str, Any] | None:
     try:
-        loaded = yaml.safe_load(parts[1])
+        loaded = yaml.load(raw, Loader=_YamlLoader)
     except yaml.YAMLError:
         return None
     return loaded if isinstance(loaded, dict) else None
 
 
+def _read_frontmatter_block(path: Path) -> bytes | None:
+    """Read *path* only up to the closing ``---`` of its frontmatter.
+
+    Returns the raw bytes between the delimiters, split exactly where
+    :func:`extract_frontmatter` would split the full text, or None when
+    the file has no complete frontmatter block.
+    """
+    with path.open("rb") as handle:
+        buffer = bytearray(handle.read(_FRONTMATTER_READ_CHUNK))
+        if not buffer.startswith(b"---"):
+            return None
+        start = 3
+        while True:
+            end = buffer.find(b"---", start)
+            if end != -1:
+                return bytes(buffer[3:end])
+            chunk = handle.read(_FRONTMATTER_READ_CHUNK)
+            if not chunk:
+                return None
+            # A delimiter may straddle the chunk boundary.
+            start = max(3, len(buffer) - 2)
+            buffer += chunk
+
+
+def _read_frontmatter(path: Path) -> dict[str, Any] | None:
+    # libyaml decodes the bytes itself, so the block is never turned into str here.
+    block = _read_frontmatter_block(path)
+    return _load_mapping(block) if block is not None else None
+
+
 def _normalize_string_candidate(value: Any) -> str:
     """Normalize scalar values that should be treated like strings."""
     if isinstance(value, str):
@@ -43,110 +188,133 @@ def _normalize_string_candidate(value: Any) -> str:
     return str(value)
 
 
-def _is_type(value: Any, expected_type: str) -> bool:
-    if expected_type == "string":
-        return isinstance(value, str) or isinstance(value, (date, datetime))
-    if expected_type == "integer":
-        return isinstance(value, int) and not isinstance(value, bool)
-    if expected_type == "number":
-        return isinstance(value, (int, float)) and not isinstance(value, bool)
-    if expected_type == "boolean":
-        return isinstance(value, bool)
-    if expected_type == "array":
-        return isinstance(value, list)
-    if expected_type == "object":
-        return isinstance(value, dict)
-    if expected_type == "null":
-        return value is None
+def _accept_any(value: Any) -> bool:
     return True
 
 
+# JSON Schema type name -> predicate. Dates count as strings because YAML
+# loads unquoted ISO dates as date objects.
+_TYPE_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": lambda v: isinstance(v, (str, date, datetime)),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "array": lambda v: isinstance(v, list),
+    "object": lambda v: isinstance(v, dict),
+    "null": lambda v: v is None,
+}
+
+
+def _is_type(value: Any, expected_type: str) -> bool:
+    return _TYPE_CHECKS.get(expected_type, _accept_any)(value)
+
+
 def _type_matches(value: Any, expected_type: Any) -> bool:
     if isinstance(expected_type, str):
         return _is_type(value, expected_type)
-    if isinstance(expected_type, list):
+    if isinstance(expected_type, (list, tuple)):
         return any(isinstance(item, str) and _is_type(value, item) for item in expected_type)
     return True
 
 
-def _validate_node(value: Any, schema: dict[str, Any], location: str) -> list[str]:
+def _infer_kind(value: Any) -> str:
+    """Classify *value* once for the string/array/object branches of validation."""
+    if isinstance(value, (str, date, datetime)):
+        return "string"
+    if isinstance(value, list):
+        return "array"
+    if isinstance(value, dict):
+        return "object"
+    return "scalar"
+
+
+def _in_enum(value: Any, enum: frozenset[Any] | tuple[Any, ...]) -> bool:
+    try:
+        return value in enum
+    except TypeError:
+        # Unhashable values (lists, mappings) never equal a hashable enum member.
+        return False
+
+
+def _validate_node(value: Any, schema: dict[str, Any] | CompiledRule, location: str) -> list[str]:
+    if isinstance(schema, dict):
+        schema = _compile_rule(schema)
     errors: list[str] = []
 
-    expected_type = schema.get("type")
-    if expected_type is not None and not _type_matches(value, expected_type):
-        errors.append(f"{location}: must be of type '{expected_type}'")
+    if schema.type_checks is not None and not any(check(value) for check in schema.type_checks):
+        errors.append(f"{location}: must be of type '{schema.type_label}'")
         return errors
 
-    if "enum" in schema and value not in schema["enum"]:
-        errors.append(f"{location}: invalid value '{value}'. Allowed: {schema['enum']}")
+    if schema.enum is not None and not _in_enum(value, schema.enum):
+        errors.append(f"{location}: invalid value '{value}'. Allowed: {schema.enum_label}")
 
-    if _type_matches(value, "string"):
+    kind = _infer_kind(value)
+    if kind == "string":
         normalized = _normalize_string_candidate(value)
-        min_length = schema.get("minLength")
-        max_length = schema.get("maxLength")
-        pattern = schema.get("pattern")
-        if isinstance(min_length, int) and len(normalized) < min_length:
-            errors.append(f"{location}: too short ({len(normalized)} < {min_length})")
-        if isinstance(max_length, int) and len(normalized) > max_length:
-            errors.append(f"{location}: too long ({len(normalized)} > {max_length})")
-        if isinstance(pattern, str) and not re.match(pattern, normalized):
-            errors.append(f"{location}: does not match pattern '{pattern}'")
-
-    if _type_matches(value, "array"):
-        if not isinstance(value, list):
-            return errors
-        min_items = schema.get("minItems")
-        max_items = schema.get("maxItems")
-        if isinstance(min_items, int) and len(value) < min_items:
-            errors.append(f"{location}: too few items ({len(value)} < {min_items})")
-        if isinstance(max_items, int) and len(value) > max_items:
-            errors.append(f"{location}: too many items ({len(value)} > {max_items})")
-        if schema.get("uniqueItems") is True:
-            normalized_items = [str(item) for item in value]
-            if len(normalized_items) != len(set(normalized_items)):
-                errors.append(f"{location}: must contain unique items")
-        item_schema = schema.get("items")
-        if isinstance(item_schema, dict):
+        if schema.min_length is not None and len(normalized) < schema.min_length:
+            errors.append(f"{location}: too short ({len(normalized)} < {schema.min_length})")
+        if schema.max_length is not None and len(normalized) > schema.max_length:
+            errors.append(f"{location}: too long ({len(normalized)} > {schema.max_length})")
+        if schema.pattern_re is not None and not schema.pattern_re.match(normalized):
+            errors.append(f"{location}: does not match pattern '{schema.pattern}'")
+    elif kind == "array":
+        if schema.min_items is not None and len(value) < schema.min_items:
+            errors.append(f"{location}: too few items ({len(value)} < {schema.min_items})")
+        if schema.max_items is not None and len(value) > schema.max_items:
+            errors.append(f"{location}: too many items ({len(value)} > {schema.max_items})")
+        if schema.unique_items:
+            seen: set[str] = set()
+            for item in value:
+                key = item if isinstance(item, str) else str(item)
+                if key in seen:
+                    errors.append(f"{location}: must contain unique items")
+                    break
+                seen.add(key)
+        if schema.items is not None:
             for index, item in enumerate(value):
-                errors.extend(_validate_node(item, item_schema, f"{location}[{index}]"))
-
-    if _type_matches(value, "object"):
-        if not isinstance(value, dict):
-            return errors
-        required = schema.get("required", [])
-        if isinstance(required, list):
-            for field in required:
+                errors.extend(_validate_node(item, schema.items, f"{location}[{index}]"))
+    elif kind == "object":
+        if not schema.required_set <= value.keys():
+            for field in schema.required:
                 if field not in value:
                     errors.append(f"{location}.{field}: missing required field")
-        properties = schema.get("properties", {})
-        if isinstance(properties, dict):
-            for field, field_schema in properties.items():
-                if field in value and isinstance(field_schema, dict):
-                    errors.extend(_validate_node(value[field], field_schema, f"{location}.{field}"))
+        for field, field_rule in schema.properties:
+            if field in value:
+                errors.extend(_validate_node(value[field], field_rule, f"{location}.{field}"))
 
     return errors
 
 
-def validate_file(filepath: Path, schema: dict[str, Any]) -> list[str]:
-    """Validate one Markdown file against schema."""
-    text = filepath.read_text(encoding="utf-8")
-    frontmatter = extract_frontmatter(text)
+def validate_file(filepath: Path, schema: dict[str, Any] | CompiledRule) -> list[str]:
+    """Validate one Markdown file against schema.
+
+    *schema* may be the raw mapping from :func:`load_schema` or a rule
+    compiled ahead of time (see :func:`_compiled_schema`); compiling once
+    and reusing it across files avoids re-walking the schema per file.
+    """
+    return _validate_frontmatter(_read_frontmatter(filepath), filepath, schema)
+
+
+def _validate_frontmatter(
+    frontmatter: dict[str, Any] | None,
+    filepath: Path,
+    schema: dict[str, Any] | CompiledRule,
+) -> list[str]:
+    if isinstance(schema, dict):
+        schema = _compile_rule(schema)
     if frontmatter is None:
         return [f"{filepath}: missing or invalid frontmatter"]
 
     errors: list[str] = []
-    required_fields = schema.get("required", [])
-    if isinstance(required_fields, list):
-        for field in required_fields:
+    # One set comparison covers the usual case; list what is missing in schema order.
+    if not schema.required_set <= frontmatter.keys():
+        for field in schema.required:
             if field not in frontmatter:
                 errors.append(f"{filepath}: missing required field '{field}'")
 
-    properties = schema.get("properties", {})
-    if isinstance(properties, dict):
-        for field, rules in properties.items():
-            if field in frontmatter and isinstance(rules, dict):
-                field_errors = _validate_node(frontmatter[field], rules, f"{filepath}:{field}")
-                errors.extend(field_errors)
+    for field, rule in schema.properties:
+        if field in frontmatter:
+            errors.extend(_validate_node(frontmatter[field], rule, f"{filepath}:{field}"))
 
     errors.extend(_validate_lifecycle_fields(frontmatter, filepath))
 
@@ -190,7 +358,7 @@ def _validate_lifecycle_fields(frontmatter: dict[str, Any], filepath: Path) -> l
     for field in ("deprecated_since", "removal_date"):
         value = frontmatter.get(field)
         normalized = _normalize_string_candidate(value).strip() if value is not None else ""
-        if normalized and not re.match(r"^[0-9]{4}-[0-9]{2}-[0-9]{2}$", normalized):
+        if normalized and not _ISO_DATE_RE.match(normalized):
             errors.append(f"{filepath}: {field} must match YYYY-MM-DD")
 
     replacement_url = frontmatter.get("replacement_url")
@@ -228,7 +396,7 @@ def _validate_i18n_fields(
         try:
             rel = filepath.relative_to(docs_path)
             parts = rel.parts
-            if parts and re.match(r"^[a-z]{2,3}$", parts[0]):
+            if parts and _LOCALE_DIR_RE.match(parts[0]):
                 folder_locale = parts[0]
                 if language != folder_locale:
                     errors.append(
@@ -254,8 +422,62 @@ def _validate_i18n_fields(
     return errors
 
 
+def _validate_docs_file(md_file: Path, docs_path: Path) -> tuple[list[str], bool]:
+    """Run schema, lifecycle, and i18n checks for one docs file.
+
+    Returns the errors and whether they depend on this file alone; a
+    ``translation_of`` check also depends on another file existing, so
+    those results must not be cached.
+    """
+    fm = _read_frontmatter(md_file)
+    errors = _validate_frontmatter(fm, md_file, _compiled_schema())
+
+    # Validate i18n fields
+    if fm is not None:
+        errors.extend(_validate_i18n_fields(fm, md_file, docs_path))
+    return errors, not (fm and fm.get("translation_of"))
+
+
+def _validation_cache_enabled() -> bool:
+    return os.environ.get("FRONTMATTER_CACHE") != "0" and not os.environ.get("PRE_COMMIT")
+
+
+@functools.lru_cache(maxsize=1)
+def _validator_digest() -> bytes:
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).digest()
+
+
+def _schema_fingerprint(schema_path: str = "docs-schema.yml") -> str:
+    digest = hashlib.blake2b(Path(schema_path).read_bytes(), digest_size=16)
+    digest.update(_validator_digest())
+    return digest.hexdigest()
+
+
+def _load_validation_cache(path: Path, schema_key: str) -> dict[str, dict[str, Any]]:
+    """Return cached per-file results, or nothing if they were built for another schema."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("schema") != schema_key:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_validation_cache(path: Path, schema_key: str, entries: dict[str, dict[str, Any]]) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({"schema": schema_key, "files": entries}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        # The cache is an optimisation only; a read-only checkout still validates.
+        tmp.unlink(missing_ok=True)
+
+
 def main() -> None:
-    schema = load_schema()
+    _compiled_schema()
     all_errors: list[str] = []
 
     docs_path = Path("docs")
@@ -263,16 +485,44 @@ def main() -> None:
         print("Error: docs/ directory not found", file=sys.stderr)
         sys.exit(1)
 
-    for md_file in sorted(docs_path.rglob("*.md")):
-        if md_file.name.startswith("_"):
-            continue
-        all_errors.extend(validate_file(md_file, schema))
-
-        # Validate i18n fields
-        text = md_file.read_text(encoding="utf-8")
-        fm = extract_frontmatter(text)
-        if fm is not None:
-            all_errors.extend(_validate_i18n_fields(fm, md_file, docs_path))
+    files = sorted(p for p in docs_path.rglob("*.md") if not p.name.startswith("_"))
+
+    # Reuse results for files whose mtime and size are unchanged since the last run.
+    use_cache = _validation_cache_enabled()
+    schema_key = _schema_fingerprint()
+    cached = _load_validation_cache(_VALIDATION_CACHE_PATH, schema_key) if use_cache else {}
+    entries: dict[str, dict[str, Any]] = {}
+    results: dict[Path, list[str]] = {}
+    stale: list[Path] = []
+    stats: dict[Path, os.stat_result] = {}
+    for md_file in files:
+        st = stats[md_file] = md_file.stat()
+        entry = cached.get(str(md_file))
+        if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            results[md_file] = entry["errors"]
+            entries[str(md_file)] = entry
+        else:
+            stale.append(md_file)
+
+    check = functools.partial(_validate_docs_file, docs_path=docs_path)
+    workers = min(os.cpu_count() or 1, len(stale) // _FILES_PER_WORKER)
+    if workers > 1:
+        # Each worker compiles the schema once up front; results come back in file order.
+        with ProcessPoolExecutor(max_workers=workers, initializer=_compiled_schema) as executor:
+            checked = list(executor.map(check, stale, chunksize=_FILES_PER_WORKER))
+    else:
+        checked = [check(md_file) for md_file in stale]
+
+    for md_file, (errors, cacheable) in zip(stale, checked):
+        results[md_file] = errors
+        if cacheable:
+            st = stats[md_file]
+            entries[str(md_file)] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "errors": errors}
+
+    if use_cache:
+        _save_validation_cache(_VALIDATION_CACHE_PATH, schema_key, entries)
+    for md_file in files:
+        all_errors.extend(results[md_file])
 
     if all_errors:
         print(f"\nFrontmatter validation: {len(all_errors)} error(s)\n", file=sys.stderr)
@@ -1163,6 +1163,9 @@ def create_bundle(profile_path: Path) -> Path:
     for req in required_scripts:
         if req not in include_scripts:
             include_scripts.append(req)
+    # Shared JSON helper imported by the Algolia uploader
+    if "scripts/upload_to_algolia.py" in include_scripts and "scripts/fast_json.py" not in include_scripts:
+        include_scripts.append("scripts/fast_json.py")
     include_paths = [str(rel) for rel in bundle_cfg.get("include_paths", [])]
     ip_protection_path = REPO_ROOT / "config" / "ip_protection"
     if ip_protection_path.exists() and "config/ip_protection" not in include_paths:
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+Both backends produce the same bytes: compact separators by default,
+two-space indentation when asked, and dataclasses and datetimes are left
+to ``default`` because the stdlib cannot serialize them natively either.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    sort_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """Serialize *obj* to UTF-8 JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    text = json.dumps(
+        obj,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=(",", ": ") if indent else (",", ":"),
+        sort_keys=sort_keys,
+        default=default,
+    )
+    return text.encode("utf-8")
+
+
+def loads(raw: "bytes | str") -> Any:
+    """Parse JSON from bytes or text."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -12,15 +12,27 @@ Combines all SEO/GEO functionality:
 """
 
 import argparse
+import functools
 import json
 import yaml
 import re
 import sys
 import hashlib
+import itertools
+import os
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 from urllib.parse import quote
 import subprocess
+from concurrent.futures import ProcessPoolExecutor
+import dataclasses
+from dataclasses import dataclass, field
+
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader  # type: ignore[assignment]
 
 # -- Pack runtime integration (optional) --------------------------------------
 try:
@@ -61,10 +73,10 @@ def _get_effective_geo_rules() -> dict:
         "meta_desc_min_chars": 50,
         "meta_desc_max_chars": 160,
         "min_heading_words": 3,
-        "generic_headings": [
+        "generic_headings": frozenset({
             "overview", "introduction", "configuration", "setup",
             "details", "information", "general", "notes", "summary",
-        ],
+        }),
         "definition_patterns": [
             r"\bis\b", r"\benables?\b", r"\bprovides?\b", r"\ballows?\b",
             r"\bcreates?\b", r"\bprocesses?\b", r"\bexecutes?\b",
@@ -77,7 +89,19 @@ def _get_effective_geo_rules() -> dict:
     }
 
 
-GEO_RULES = _get_effective_geo_rules()
+def _freeze_geo_rules(rules: dict) -> dict:
+    """Return a copy of ``rules`` with membership-tested lists as frozensets.
+
+    Pack-provided rules arrive as YAML lists; headings are looked up once per
+    heading in every file, so they are stored as a frozenset.
+    """
+    frozen = dict(rules)
+    if "generic_headings" in frozen:
+        frozen["generic_headings"] = frozenset(frozen["generic_headings"])
+    return frozen
+
+
+GEO_RULES = _freeze_geo_rules(_get_effective_geo_rules())
 
 def _get_effective_geo_rules_by_locale() -> dict[str, dict]:
     """Load locale-specific GEO overrides from pack or use hardcoded defaults."""
@@ -87,12 +111,12 @@ def _get_effective_geo_rules_by_locale() -> dict[str, dict]:
         "ru": {
             "first_para_max_words": 80,
             "meta_desc_max_chars": 200,
-            "generic_headings": [
+            "generic_headings": frozenset({
                 "overview", "introduction", "configuration", "setup",
                 "details", "information", "general", "notes", "summary",
                 "obzor", "vvedenie", "nastroyka", "nastrojka",
                 "podrobnosti", "informatsiya", "obshchee", "zametki",
-            ],
+            }),
             "definition_patterns": [
                 r"\bis\b", r"\benables?\b", r"\bprovides?\b", r"\ballows?\b",
                 r"\bcreates?\b", r"\bprocesses?\b", r"\bexecutes?\b",
@@ -107,12 +131,12 @@ def _get_effective_geo_rules_by_locale() -> dict[str, dict]:
         "de": {
             "first_para_max_words": 70,
             "meta_desc_max_chars": 180,
-            "generic_headings": [
+            "generic_headings": frozenset({
                 "overview", "introduction", "configuration", "setup",
                 "details", "information", "general", "notes", "summary",
                 "ueberblick", "uebersicht", "einleitung", "konfiguration",
                 "einrichtung", "details", "informationen", "allgemein",
-            ],
+            }),
             "definition_patterns": [
                 r"\bis\b", r"\benables?\b", r"\bprovides?\b", r"\ballows?\b",
                 r"\bcreates?\b", r"\bprocesses?\b", r"\bexecutes?\b",
@@ -125,7 +149,10 @@ def _get_effective_geo_rules_by_locale() -> dict[str, dict]:
 # Per-locale GEO rule overrides.
 # Keys are locale codes; values override the corresponding GEO_RULES entries.
 # Languages not listed here fall back to the default English rules above.
-GEO_RULES_BY_LOCALE: dict[str, dict] = _get_effective_geo_rules_by_locale()
+GEO_RULES_BY_LOCALE: dict[str, dict] = {
+    locale: _freeze_geo_rules(overrides)
+    for locale, overrides in _get_effective_geo_rules_by_locale().items()
+}
 
 
 def _get_geo_rules_for_locale(locale: str | None) -> dict:
@@ -137,6 +164,33 @@ def _get_geo_rules_for_locale(locale: str | None) -> dict:
     return merged
 
 
+_BACKREFERENCE = re.compile(r"\\[1-9]")
+
+
+def _compile_any(patterns: tuple[str, ...], flags: int = 0) -> re.Pattern | None:
+    """Compile rule patterns into one alternation so a line is scanned once.
+
+    Returns None when the patterns cannot be safely combined (empty tuple,
+    numbered backreferences, inline global flags, clashing group names).
+    """
+    if not patterns or any(_BACKREFERENCE.search(p) for p in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+    except re.error:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _search_any(patterns: tuple[str, ...], flags: int = 0):
+    """Return a callable reporting whether any of ``patterns`` matches a string."""
+    combined = _compile_any(patterns, flags)
+    if combined is not None:
+        return combined.search
+    compiled = [re.compile(p, flags) for p in patterns]
+    return lambda text: any(p.search(text) for p in compiled)
+
+
 def _detect_locale_from_path(filepath) -> str | None:
     """Detect locale from docs/{locale}/... path structure."""
     parts = Path(filepath).parts
@@ -157,11 +211,151 @@ def extract_frontmatter(text):
     if len(parts) < 3:
         return {}, text
     try:
-        fm = yaml.safe_load(parts[1]) or {}
+        fm = yaml.load(parts[1], Loader=_YamlLoader) or {}
         return fm, parts[2]
     except yaml.YAMLError:
         return {}, text
 
+@dataclass
+class ParsedDoc:
+    """Markdown document split into the structures every check consumes.
+
+    ``lines`` covers the whole file (frontmatter included) so reported line
+    numbers match the file on disk; ``body_start`` is the index in ``lines``
+    where the body returned by ``extract_frontmatter`` begins.
+    """
+
+    frontmatter: dict
+    body: str
+    lines: list[str]
+    body_start: int = 0
+    headings: list[tuple[int, int, str]] = field(default_factory=list)
+    code_block_ranges: list[tuple[int, int]] = field(default_factory=list)
+    first_para: str = ""
+    main_heading: str = ""
+    sections: list[dict] = field(default_factory=list)
+
+
+_SECTION_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+
+
+def _first_paragraph(lines):
+    """Return the first prose paragraph from an iterable of lines."""
+    para = []
+    started = False
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            if started:
+                break
+            continue
+        if stripped.startswith("#"):
+            started = True
+            continue
+        para.append(stripped)
+        started = True
+    return " ".join(para)
+
+
+def parse_document(text, has_frontmatter=True):
+    """Parse markdown text in a single pass over its lines.
+
+    Tracks fenced code blocks, headings (outside code) and searchable
+    sections so GEO/SEO checks and search record generation can share one
+    parse instead of each re-splitting and re-scanning the raw text.
+    """
+    if has_frontmatter:
+        fm, body = extract_frontmatter(text)
+    else:
+        fm, body = {}, text
+    lines = text.split("\n")
+
+    # Locate the body inside ``lines``; the first body line may be the tail
+    # of the closing frontmatter delimiter line.
+    body_pos = len(text) - len(body)
+    body_start = text.count("\n", 0, body_pos)
+    line_pos = text.rfind("\n", 0, body_pos) + 1
+    body_head = lines[body_start][body_pos - line_pos:] if lines else ""
+
+    doc = ParsedDoc(frontmatter=fm, body=body, lines=lines, body_start=body_start)
+    sections = doc.sections
+    headings = doc.headings
+    section_heading, section_level, section_parts = '', 0, []
+    in_code = False
+    code_start = 0
+
+    for idx, line in enumerate(lines):
+        in_body = idx >= body_start
+        if in_body and idx == body_start:
+            line = body_head
+        if line.strip().startswith("```"):
+            if in_code:
+                doc.code_block_ranges.append((code_start, idx + 1))
+            else:
+                code_start = idx + 1
+            in_code = not in_code
+            # Indented fences (inside admonitions/tabs) stay searchable text.
+            if in_body and not line.startswith("```"):
+                section_parts.append(line)
+            continue
+        if not in_code and line.startswith("#"):
+            stripped_hashes = line.lstrip("#")
+            headings.append((idx + 1, len(line) - len(stripped_hashes), stripped_hashes.strip()))
+            if in_body:
+                match = _SECTION_HEADING_RE.match(line)
+                if match:
+                    if section_parts:
+                        sections.append({
+                            'heading': section_heading,
+                            'content': ' '.join(section_parts) + ' ',
+                            'level': section_level,
+                        })
+                    section_heading = match.group(2)
+                    section_level = len(match.group(1))
+                    if section_level == 1 and not doc.main_heading:
+                        doc.main_heading = section_heading
+                    section_parts = []
+                    continue
+        if in_body and line.strip():
+            section_parts.append(line)
+
+    if in_code:
+        doc.code_block_ranges.append((code_start, len(lines)))
+    if section_parts:
+        sections.append({
+            'heading': section_heading,
+            'content': ' '.join(section_parts) + ' ',
+            'level': section_level,
+        })
+
+    doc.first_para = _first_paragraph(
+        itertools.chain((body_head,), itertools.islice(lines, body_start + 1, None))
+    )
+    return doc
+
+
+def _iter_markdown_files(docs_dir):
+    """Yield paths (as strings) of ``.md`` files under ``docs_dir``.
+
+    Files whose name starts with ``_`` are skipped. Walks with ``os.walk`` so
+    no ``Path`` objects are built for entries that are not markdown docs.
+    """
+    for root, _dirs, names in os.walk(docs_dir):
+        for name in names:
+            if name.endswith('.md') and not name.startswith('_'):
+                yield os.path.join(root, name)
+
+
+@functools.lru_cache(maxsize=4096)
+def _doc_url_path(filepath):
+    """Return the site-relative URL path for a doc file (``docs/`` and ``.md`` removed).
+
+    Memoized because structured data, meta tags, the sitemap entry and every
+    search record of a file all need the same value.
+    """
+    return str(filepath).replace('docs/', '').replace('.md', '')
+
+
 def get_git_info(filepath):
     """Get git information for a file."""
     try:
@@ -199,31 +393,120 @@ class GEOFinding:
     def __str__(self):
         return f"  {self.filepath}:{self.line} [{self.severity}] {self.rule}: {self.message}"
 
+class ParsedDocCache:
+    """On-disk cache of ``ParsedDoc`` objects keyed by a hash of the file text.
+
+    Lets repeat runs (CI re-runs, local iterations) skip parsing files whose
+    content has not changed. Entries are plain JSON, and documents whose
+    frontmatter does not survive a JSON round trip (dates, non-string keys)
+    are simply re-parsed each run. Call ``evict`` once per run to drop
+    entries untouched for ``max_age_days``.
+    """
+
+    # Bump when parse_document output changes so stale entries are ignored.
+    VERSION = 2
+
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def evict(self, max_age_days=14):
+        """Remove entries not used for ``max_age_days``."""
+        cutoff = time.time() - max_age_days * 86400
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith(('.json', '.pkl')):
+                continue
+            # Another process may rewrite or remove the entry meanwhile.
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _from_json(data):
+        data['headings'] = [tuple(h) for h in data['headings']]
+        data['code_block_ranges'] = [tuple(r) for r in data['code_block_ranges']]
+        return ParsedDoc(**data)
+
+    def parse(self, text):
+        """Return the ``ParsedDoc`` for ``text``, parsing and storing it on a miss."""
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        entry = self.cache_dir / f"v{self.VERSION}-{digest}.json"
+        try:
+            with entry.open('r', encoding='utf-8') as fh:
+                doc = self._from_json(json.load(fh))
+            os.utime(entry)  # keep recently used entries out of eviction
+            return doc
+        except (OSError, ValueError, TypeError, KeyError, AttributeError):
+            pass
+        doc = parse_document(text)
+        try:
+            payload = json.dumps(dataclasses.asdict(doc))
+        except (TypeError, ValueError):
+            return doc
+        if self._from_json(json.loads(payload)) != doc:
+            return doc
+        tmp = entry.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            tmp.write_text(payload, encoding='utf-8')
+            os.replace(tmp, entry)
+        except OSError:
+            pass
+        return doc
+
+
 def get_first_paragraph(content):
     """Extract first paragraph from content."""
-    lines = content.strip().split("\n")
-    para = []
-    started = False
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            if started:
-                break
+    return _first_paragraph(content.strip().split("\n"))
+
+def _scan_fact_density(lines, fact_search, max_words):
+    """Return ``(line, word_count)`` for each prose run exceeding ``max_words`` without a fact.
+
+    Kept free of rule dicts and finding objects so the per-line loop only
+    touches locals; ``geo_lint_file`` turns the tuples into findings.
+    """
+    hits = []
+    hit = hits.append
+    in_code_block = False
+    words_since_fact = 0
+    buffer_start = 0
+    for i, line in enumerate(lines, 1):
+        if line.strip().startswith("```"):
+            in_code_block = not in_code_block
+            words_since_fact = 0
             continue
-        if stripped.startswith("#"):
-            started = True
+        if in_code_block or line.startswith("#") or line.startswith("|"):
+            words_since_fact = 0
+            buffer_start = i
             continue
-        if started or not stripped.startswith("#"):
-            para.append(stripped)
-            started = True
-    return " ".join(para)
 
-def geo_lint_file(filepath):
-    """Perform GEO linting on a file."""
+        words_since_fact += len(line.split())
+        if not buffer_start:
+            buffer_start = i
+
+        if fact_search(line):
+            words_since_fact = 0
+            buffer_start = i
+
+        if words_since_fact > max_words:
+            hit((buffer_start, words_since_fact))
+            words_since_fact = 0
+            buffer_start = i
+    return hits
+
+
+def geo_lint_file(filepath, doc=None):
+    """Perform GEO linting on a file.
+
+    ``doc`` is an optional ``ParsedDoc`` for the file; when omitted the file
+    is read and parsed here.
+    """
     findings = []
-    text = filepath.read_text(encoding="utf-8")
-    fm, content = extract_frontmatter(text)
-    lines = text.split("\n")
+    if doc is None:
+        doc = parse_document(filepath.read_text(encoding="utf-8"))
+    fm = doc.frontmatter
+    lines = doc.lines
 
     # Detect locale and load locale-specific rules
     locale = _detect_locale_from_path(filepath)
@@ -242,7 +525,7 @@ def geo_lint_file(filepath):
                                 f"Description too long ({len(desc)} > {rules['meta_desc_max_chars']} chars)"))
 
     # Rule 2: First paragraph density
-    first_para = get_first_paragraph(content)
+    first_para = doc.first_para
     word_count = len(first_para.split())
     if word_count > rules["first_para_max_words"]:
         findings.append(GEOFinding(filepath, 3, "first-paragraph-too-long",
@@ -250,87 +533,69 @@ def geo_lint_file(filepath):
                                 "LLMs extract the first ~60 words for answers."))
 
     # Rule 3: First paragraph should contain a definition
-    has_definition = any(re.search(p, first_para, re.IGNORECASE) for p in rules["definition_patterns"])
+    definition_search = _search_any(tuple(rules["definition_patterns"]), re.IGNORECASE)
+    has_definition = bool(definition_search(first_para))
     if first_para and not has_definition:
         findings.append(GEOFinding(filepath, 3, "first-paragraph-no-definition",
                                 "First paragraph lacks a definition pattern (is/enables/provides). "
                                 "LLMs need explicit definitions to extract answers.", "suggestion"))
 
     # Rule 4: Generic headings
-    in_code_block_g = False
-    for i, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
-            in_code_block_g = not in_code_block_g
-            continue
-        if in_code_block_g:
-            continue
-        if line.startswith("#"):
-            heading_text = re.sub(r'^#+\s*', '', line).strip().lower()
-            if heading_text in rules["generic_headings"]:
-                findings.append(GEOFinding(filepath, i, "heading-generic",
-                                        f"Generic heading '{line.strip()}'. Use descriptive headings "
-                                        "for LLM retrieval (e.g., 'Configure SASL authentication' not 'Configuration')."))
+    for i, _level, heading_text in doc.headings:
+        if heading_text.lower() in rules["generic_headings"]:
+            findings.append(GEOFinding(filepath, i, "heading-generic",
+                                    f"Generic heading '{lines[i - 1].strip()}'. Use descriptive headings "
+                                    "for LLM retrieval (e.g., 'Configure SASL authentication' not 'Configuration')."))
 
     # Rule 5: Heading hierarchy
     prev_level = 0
-    in_code_block_h = False
-    for i, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
-            in_code_block_h = not in_code_block_h
-            continue
-        if in_code_block_h:
-            continue
-        if line.startswith("#"):
-            level = len(line.split()[0]) if line.split() else 0
-            if level > prev_level + 1 and prev_level > 0:
-                findings.append(GEOFinding(filepath, i, "heading-hierarchy-skip",
-                                        f"Heading level skipped: H{prev_level} -> H{level}", "error"))
-            prev_level = level
+    for i, level, _heading_text in doc.headings:
+        if level > prev_level + 1 and prev_level > 0:
+            findings.append(GEOFinding(filepath, i, "heading-hierarchy-skip",
+                                    f"Heading level skipped: H{prev_level} -> H{level}", "error"))
+        prev_level = level
 
     # Rule 6: Fact density
-    in_code_block = False
-    word_buffer = []
-    buffer_start = 0
-    for i, line in enumerate(lines, 1):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            word_buffer = []
-            continue
-        if in_code_block or line.startswith("#") or line.startswith("|"):
-            word_buffer = []
-            buffer_start = i
-            continue
+    fact_search = _search_any(tuple(rules.get("fact_patterns", GEO_RULES["fact_patterns"])))
+    for buffer_start, word_count in _scan_fact_density(lines, fact_search, rules["max_words_without_fact"]):
+        findings.append(GEOFinding(filepath, buffer_start, "low-fact-density",
+                                f"{word_count} words without concrete facts "
+                                f"(numbers, code, config values). Add specifics for LLM extraction."))
 
-        word_buffer.extend(line.split())
-        if not buffer_start:
-            buffer_start = i
+    return findings
 
-        has_fact = any(re.search(p, line) for p in rules.get("fact_patterns", GEO_RULES["fact_patterns"]))
-        if has_fact:
-            word_buffer = []
-            buffer_start = i
+# ==================== SEO ENHANCEMENT ====================
 
-        if len(word_buffer) > rules["max_words_without_fact"]:
-            findings.append(GEOFinding(filepath, buffer_start, "low-fact-density",
-                                    f"{len(word_buffer)} words without concrete facts "
-                                    f"(numbers, code, config values). Add specifics for LLM extraction."))
-            word_buffer = []
-            buffer_start = i
+_ISO_DAY_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
 
-    return findings
 
-# ==================== SEO ENHANCEMENT ====================
+def _days_since(value, now):
+    """Whole days between ``value`` (ISO date string or date) and ``now``."""
+    if isinstance(value, datetime):
+        return (now - value).days
+    if isinstance(value, date):
+        return now.toordinal() - value.toordinal()
+    if _ISO_DAY_RE.match(value):
+        # Plain YYYY-MM-DD: integer ordinal math, no datetime parsing.
+        return now.toordinal() - date(int(value[:4]), int(value[5:7]), int(value[8:10])).toordinal()
+    return (now - datetime.fromisoformat(value)).days
+
+
+_STEP_RE = re.compile(r'^\d+\.\s+(.+?)(?=^\d+\.|^#{1,6}\s|$)', re.MULTILINE | re.DOTALL)
+_NEWLINE_RUN_RE = re.compile(r'\n+')
+
 
 class SEOEnhancer:
     def __init__(self, base_url="https://docs.example.com"):
         self.base_url = base_url.rstrip('/')
 
-    def generate_structured_data(self, filepath, frontmatter, content):
+    def generate_structured_data(self, filepath, frontmatter, content, doc=None):
         """Generate JSON-LD structured data for better search engine understanding."""
 
         # Extract main heading
-        heading_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        main_heading = heading_match.group(1) if heading_match else frontmatter.get('title', '')
+        if doc is None:
+            doc = parse_document(content, has_frontmatter=False)
+        main_heading = doc.main_heading or frontmatter.get('title', '')
 
         # Determine article type
         content_type = frontmatter.get('content_type', 'article')
@@ -348,7 +613,7 @@ class SEOEnhancer:
             "@type": article_type,
             "headline": main_heading,
             "description": frontmatter.get('description', ''),
-            "url": f"{self.base_url}/{str(filepath).replace('docs/', '').replace('.md', '')}",
+            "url": f"{self.base_url}/{_doc_url_path(filepath)}",
             "dateModified": frontmatter.get('last_reviewed', datetime.now().isoformat()),
             "author": {
                 "@type": "Organization",
@@ -382,20 +647,15 @@ class SEOEnhancer:
 
     def _extract_steps(self, content):
         """Extract numbered steps for HowTo schema."""
-        steps = []
-        step_pattern = r'^\d+\.\s+(.+?)(?=^\d+\.|^#{1,6}\s|$)'
-        matches = re.findall(step_pattern, content, re.MULTILINE | re.DOTALL)
-
-        for i, step_text in enumerate(matches, 1):
-            step_text = re.sub(r'\n+', ' ', step_text).strip()
-            steps.append({
+        return [
+            {
                 "@type": "HowToStep",
                 "position": i,
                 "name": f"Step {i}",
-                "text": step_text[:500]
-            })
-
-        return steps
+                "text": _NEWLINE_RUN_RE.sub(' ', step_text).strip()[:500]
+            }
+            for i, step_text in enumerate(_STEP_RE.findall(content), 1)
+        ]
 
     def _extract_qa_pairs(self, content):
         """Extract Q&A pairs for FAQ schema."""
@@ -446,7 +706,7 @@ class SEOEnhancer:
         description = frontmatter.get('description', '')
 
         # Generate canonical URL
-        canonical = f"{self.base_url}/{str(filepath).replace('docs/', '').replace('.md', '')}"
+        canonical = f"{self.base_url}/{_doc_url_path(filepath)}"
 
         meta_tags = {
             # Basic meta tags
@@ -482,8 +742,16 @@ class SEOEnhancer:
 
         return meta_tags
 
-    def generate_sitemap_entry(self, filepath, frontmatter):
-        """Generate sitemap entry for the file."""
+    def generate_sitemap_entry(self, filepath, frontmatter, *, now=None, now_iso=None):
+        """Generate sitemap entry for the file.
+
+        Callers building many entries pass one ``now`` (and its ``now_iso``
+        date string) so the clock is read once per run, not per file.
+        """
+        if now is None:
+            now = datetime.now()
+        if now_iso is None:
+            now_iso = now.isoformat()[:10]
 
         # Determine priority based on content type and path
         priority = 0.5  # default
@@ -500,7 +768,7 @@ class SEOEnhancer:
         # Determine change frequency
         last_reviewed = frontmatter.get('last_reviewed', '')
         if last_reviewed:
-            days_old = (datetime.now() - datetime.fromisoformat(last_reviewed)).days
+            days_old = _days_since(last_reviewed, now)
             if days_old < 30:
                 changefreq = 'weekly'
             elif days_old < 90:
@@ -511,8 +779,8 @@ class SEOEnhancer:
             changefreq = 'monthly'
 
         return {
-            'loc': f"{self.base_url}/{str(filepath).replace('docs/', '').replace('.md', '')}",
-            'lastmod': last_reviewed or datetime.now().isoformat()[:10],
+            'loc': f"{self.base_url}/{_doc_url_path(filepath)}",
+            'lastmod': last_reviewed or now_iso,
             'changefreq': changefreq,
             'priority': priority
         }
@@ -539,11 +807,12 @@ def _get_effective_seo_rules() -> dict:
 SEO_RULES = _get_effective_seo_rules()
 
 
-def seo_validate_file(filepath):
+def seo_validate_file(filepath, doc=None):
     """Validate SEO best practices on an existing documentation file.
 
     Returns a list of GEOFinding objects (reusing the same data class
-    since findings are structurally identical).
+    since findings are structurally identical). ``doc`` is an optional
+    ``ParsedDoc`` for the file, shared with ``geo_lint_file``.
 
     Checks performed (14 rules):
       SEO-01  Title length optimization
@@ -562,9 +831,10 @@ def seo_validate_file(filepath):
       SEO-14  Structured data presence (code blocks / tables)
     """
     findings = []
-    text = filepath.read_text(encoding="utf-8")
-    fm, content = extract_frontmatter(text)
-    lines = text.split("\n")
+    if doc is None:
+        doc = parse_document(filepath.read_text(encoding="utf-8"))
+    fm, content = doc.frontmatter, doc.body
+    lines = doc.lines
 
     # --- SEO-01: Title length ---
     title = fm.get("title", "")
@@ -721,80 +991,115 @@ def seo_validate_file(filepath):
 
 # ==================== ALGOLIA SEARCH OPTIMIZATION ====================
 
-class AlgoliaOptimizer:
-    def __init__(self):
-        self.records = []
+# Links, inline code, bold and italic, stripped to their text in one pass.
+_MD_CLEAN_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)|`([^`]+)`|\*\*([^*]+)\*\*|\*([^*]+)\*')
 
-    def extract_content_sections(self, content):
-        """Split content into searchable sections."""
-        sections = []
-        current_section = {
-            'heading': '',
-            'content': '',
-            'level': 0
-        }
 
-        lines = content.split('\n')
-        for line in lines:
-            heading_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-            if heading_match:
-                if current_section['content'].strip():
-                    sections.append(current_section)
-
-                level = len(heading_match.group(1))
-                current_section = {
-                    'heading': heading_match.group(2),
-                    'content': '',
-                    'level': level
-                }
-            else:
-                if line.strip() and not line.startswith('```'):
-                    current_section['content'] += line + ' '
+def _md_clean_match(match):
+    # Clean the captured text too so nested markup (e.g. a bold link) is removed.
+    return _MD_CLEAN_RE.sub(_md_clean_match, match.group(match.lastindex))
+
+
+_HIERARCHY_KEYS = ('lvl0', 'lvl1', 'lvl2', 'lvl3', 'lvl4')
+_EMPTY_HIERARCHY = ('', '', '', '', '')
+
+
+class AlgoliaRecordStream:
+    """Write the Algolia payload file incrementally as records are produced.
+
+    The file has the same ``{"records": [...], "config": {...}}`` layout (and
+    bytes) as ``json.dump(payload, indent=2)``, but records are serialized one
+    at a time instead of being held in memory until the end of the run.
+    Records go to a sibling ``.tmp`` file that replaces ``path`` only on
+    ``close``, so a failed run leaves the previous payload in place.
+    """
 
-        if current_section['content'].strip():
-            sections.append(current_section)
+    def __init__(self, path):
+        self.count = 0
+        self._path = Path(path)
+        self._tmp_path = self._path.with_name(self._path.name + '.tmp')
+        self._fp = open(self._tmp_path, 'w')
+        self._fp.write('{\n  "records": [')
 
-        return sections
+    def write(self, record):
+        self._fp.write(',\n    ' if self.count else '\n    ')
+        self._fp.write(json.dumps(record, indent=2, default=str).replace('\n', '\n    '))
+        self.count += 1
+
+    def close(self, config):
+        self._fp.write('\n  ],\n  "config": ' if self.count else '],\n  "config": ')
+        self._fp.write(json.dumps(config, indent=2, default=str).replace('\n', '\n  '))
+        self._fp.write('\n}')
+        self._fp.close()
+        os.replace(self._tmp_path, self._path)
+
+
+class AlgoliaOptimizer:
+    # Ranking boost per content type
+    _CONTENT_TYPE_BOOSTS = {
+        'tutorial': 10,
+        'how-to': 8,
+        'reference': 6,
+        'concept': 4,
+        'troubleshooting': 2
+    }
+
+    def __init__(self, sink=None):
+        # Records are kept in ``records`` unless a ``sink`` callable is given,
+        # in which case each record is handed to it and only counted here.
+        self.records = []
+        self.record_count = 0
+        self.content_type_counts = {}
+        self._sink = sink
+
+    def add_record(self, record):
+        """Register a generated record for output and report statistics."""
+        self.record_count += 1
+        content_type = record.get('content_type', 'unknown')
+        self.content_type_counts[content_type] = self.content_type_counts.get(content_type, 0) + 1
+        if self._sink is not None:
+            self._sink(record)
+        else:
+            self.records.append(record)
+
+    def extract_content_sections(self, content, doc=None):
+        """Split content into searchable sections.
+
+        Sections come from ``parse_document``; pass ``doc`` to reuse an
+        existing parse of the same file.
+        """
+        if doc is None:
+            doc = parse_document(content, has_frontmatter=False)
+        return doc.sections
 
     def create_search_record(self, filepath, frontmatter, section, section_index):
         """Create an Algolia record from a document section."""
 
-        # Generate unique objectID
-        object_id = hashlib.sha256(
-            f"{filepath}#{section_index}".encode()
-        ).hexdigest()[:32]
+        # Generate unique objectID (identifier only, no security role)
+        object_id = hashlib.blake2b(
+            f"{filepath}#{section_index}".encode(), digest_size=16
+        ).hexdigest()
 
         # Clean content for search
-        content = section['content']
-        content = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', content)  # Links
-        content = re.sub(r'`([^`]+)`', r'\1', content)  # Inline code
-        content = re.sub(r'\*\*([^*]+)\*\*', r'\1', content)  # Bold
-        content = re.sub(r'\*([^*]+)\*', r'\1', content)  # Italic
+        content = _MD_CLEAN_RE.sub(_md_clean_match, section['content'])
 
         # Extract code snippets for separate indexing
         code_snippets = re.findall(r'```[^`]*```', section['content'])
 
-        # Build hierarchy for faceting
-        hierarchy = {
-            'lvl0': frontmatter.get('product', 'Documentation'),
-            'lvl1': frontmatter.get('content_type', 'General'),
-            'lvl2': section['heading'] if section['level'] == 2 else '',
-            'lvl3': section['heading'] if section['level'] == 3 else '',
-            'lvl4': section['heading'] if section['level'] == 4 else ''
-        }
+        # Build hierarchy for faceting: lvl0/lvl1 from frontmatter, the
+        # section heading at its own level (H2-H4); empty levels are omitted.
+        hierarchy_vals = list(_EMPTY_HIERARCHY)
+        hierarchy_vals[0] = frontmatter.get('product', 'Documentation')
+        hierarchy_vals[1] = frontmatter.get('content_type', 'General')
+        if 2 <= section['level'] <= 4:
+            hierarchy_vals[section['level']] = section['heading']
+        hierarchy = {_HIERARCHY_KEYS[i]: value for i, value in enumerate(hierarchy_vals) if value}
 
         # Calculate ranking boost
         ranking_boost = 0
 
         # Boost based on content type
-        content_type_boosts = {
-            'tutorial': 10,
-            'how-to': 8,
-            'reference': 6,
-            'concept': 4,
-            'troubleshooting': 2
-        }
-        ranking_boost += content_type_boosts.get(frontmatter.get('content_type', ''), 0)
+        ranking_boost += self._CONTENT_TYPE_BOOSTS.get(frontmatter.get('content_type', ''), 0)
 
         # Boost based on path depth (shallower = more important)
         path_depth = len(Path(filepath).parts) - 2
@@ -829,7 +1134,7 @@ class AlgoliaOptimizer:
             'hierarchy': hierarchy,
 
             # Metadata
-            'url': f"/{str(filepath).replace('docs/', '').replace('.md', '')}#{section_index}",
+            'url': f"/{_doc_url_path(filepath)}#{section_index}",
             'last_reviewed': frontmatter.get('last_reviewed', ''),
             'path': str(filepath),
 
@@ -889,45 +1194,52 @@ class AlgoliaOptimizer:
 
 # ==================== METADATA AUTO-ENHANCEMENT ====================
 
+# Directory name -> content_type, in match priority order.
+_PATH_CONTENT_TYPES = (
+    ('getting-started', 'tutorial'), ('tutorial', 'tutorial'),
+    ('how-to', 'how-to'), ('guides', 'how-to'),
+    ('concept', 'concept'), ('concepts', 'concept'),
+    ('reference', 'reference'), ('api', 'reference'),
+    ('troubleshoot', 'troubleshooting'), ('troubleshooting', 'troubleshooting'),
+    ('release', 'release-note'), ('changelog', 'release-note'),
+)
+_PATH_CONTENT_TYPE_DIRS = frozenset(name for name, _ in _PATH_CONTENT_TYPES)
+_FILENAME_COMPONENTS = {
+    'webhook': 'webhook',
+    'http': 'http-request',
+    'code': 'code',
+    'ai': 'ai-agent',
+    'schedule': 'schedule',
+    'workflow': 'workflow-engine',
+    'credential': 'credentials',
+    'expression': 'expressions'
+}
+_UNTAGGED_DIRS = frozenset({'getting-started', 'how-to', 'reference', 'concepts', 'troubleshooting'})
+
+
 def infer_metadata_from_path(filepath):
     """Infer metadata from file path."""
     path_parts = filepath.parts
+    parts_set = frozenset(path_parts)
+    path_lower = str(filepath).lower()
     metadata = {}
 
     # Infer content_type from directory
-    if 'getting-started' in path_parts or 'tutorial' in path_parts:
-        metadata['content_type'] = 'tutorial'
-    elif 'how-to' in path_parts or 'guides' in path_parts:
-        metadata['content_type'] = 'how-to'
-    elif 'concept' in path_parts or 'concepts' in path_parts:
-        metadata['content_type'] = 'concept'
-    elif 'reference' in path_parts or 'api' in path_parts:
-        metadata['content_type'] = 'reference'
-    elif 'troubleshoot' in path_parts or 'troubleshooting' in path_parts:
-        metadata['content_type'] = 'troubleshooting'
-    elif 'release' in path_parts or 'changelog' in path_parts:
-        metadata['content_type'] = 'release-note'
+    if not parts_set.isdisjoint(_PATH_CONTENT_TYPE_DIRS):
+        for dir_name, content_type in _PATH_CONTENT_TYPES:
+            if dir_name in parts_set:
+                metadata['content_type'] = content_type
+                break
 
     # Infer product from path
-    if 'cloud' in str(filepath).lower():
+    if 'cloud' in path_lower:
         metadata['product'] = 'cloud'
-    elif 'self-hosted' in str(filepath).lower() or 'docker' in str(filepath).lower():
+    elif 'self-hosted' in path_lower or 'docker' in path_lower:
         metadata['product'] = 'self-hosted'
 
     # Infer component from filename
     filename = filepath.stem.lower()
-    components = {
-        'webhook': 'webhook',
-        'http': 'http-request',
-        'code': 'code',
-        'ai': 'ai-agent',
-        'schedule': 'schedule',
-        'workflow': 'workflow-engine',
-        'credential': 'credentials',
-        'expression': 'expressions'
-    }
-
-    for key, value in components.items():
+    for key, value in _FILENAME_COMPONENTS.items():
         if key in filename:
             metadata['app_component'] = value
             break
@@ -935,7 +1247,7 @@ def infer_metadata_from_path(filepath):
     # Auto-generate tags from path and filename
     tags = []
     for part in path_parts[1:-1]:  # Skip 'docs' and filename
-        if part not in ['getting-started', 'how-to', 'reference', 'concepts', 'troubleshooting']:
+        if part not in _UNTAGGED_DIRS:
             tags.append(part.replace('-', ' ').title())
 
     if 'app_component' in metadata:
@@ -946,25 +1258,45 @@ def infer_metadata_from_path(filepath):
 
     return metadata
 
+# Content signals for analyze_content, matched in one pass. Content types are
+# listed in priority order; the first alternative that can match wins.
+_CONTENT_SIGNALS_RE = re.compile(
+    r'(?i:(?:version |v)(?P<version>\d+\.\d+))'
+    r'|(?P<how_to>^\d+\.\s+)'
+    r'|(?P<tutorial>Prerequisites|## Before you begin)'
+    r'|(?P<troubleshooting>Problem:|Solution:|Error:)'
+    r'|(?P<reference>\| Parameter \||\| Method \|)',
+    re.MULTILINE,
+)
+_CONTENT_TYPE_SIGNALS = (
+    ('how_to', 'how-to'),
+    ('tutorial', 'tutorial'),
+    ('troubleshooting', 'troubleshooting'),
+    ('reference', 'reference'),
+)
+
+
 def analyze_content(content):
     """Analyze content to infer metadata."""
     metadata = {}
 
+    # Single scan collecting the first hit of every signal
+    found = {}
+    for match in _CONTENT_SIGNALS_RE.finditer(content):
+        found.setdefault(match.lastgroup, match)
+        if 'version' in found and 'how_to' in found:
+            break
+
     # Check for version mentions
-    version_match = re.search(r'(?:version |v)(\d+\.\d+)', content, re.IGNORECASE)
-    if version_match:
-        metadata['app_version'] = version_match.group(1)
+    if 'version' in found:
+        metadata['app_version'] = found['version'].group('version')
 
     # Infer content_type from content structure
     if not metadata.get('content_type'):
-        if re.search(r'^\d+\.\s+', content, re.MULTILINE):
-            metadata['content_type'] = 'how-to'
-        elif 'Prerequisites' in content or '## Before you begin' in content:
-            metadata['content_type'] = 'tutorial'
-        elif 'Problem:' in content or 'Solution:' in content or 'Error:' in content:
-            metadata['content_type'] = 'troubleshooting'
-        elif '| Parameter |' in content or '| Method |' in content:
-            metadata['content_type'] = 'reference'
+        for signal, content_type in _CONTENT_TYPE_SIGNALS:
+            if signal in found:
+                metadata['content_type'] = content_type
+                break
 
     return metadata
 
@@ -973,12 +1305,33 @@ def analyze_content(content):
 class ComprehensiveSEOOptimizer:
     """Main class that combines all SEO/GEO functionality."""
 
-    def __init__(self, base_url="https://docs.example.com"):
+    def __init__(self, base_url="https://docs.example.com", algolia_sink=None, doc_cache=None, now=None):
         self.base_url = base_url
+        self.doc_cache = doc_cache
         self.seo_enhancer = SEOEnhancer(base_url)
-        self.algolia = AlgoliaOptimizer()
+        self.algolia = AlgoliaOptimizer(sink=algolia_sink)
         self.findings = []
         self.enhanced_files = []
+        # Frontmatter and body per file, filled by optimize_file and reused
+        # by generate_sitemap so each doc is read and parsed once per run.
+        self._fm_cache: dict[Path, tuple[dict, str]] = {}
+        # One clock reading per run for sitemap freshness calculations;
+        # workers are handed the parent's so every file shares it.
+        self._now = now if now is not None else datetime.now()
+        self._now_iso = self._now.isoformat()[:10]
+
+    def _read(self, path):
+        """Return ``(frontmatter, body)`` for ``path``, reading it at most once."""
+        cached = self._fm_cache.get(path)
+        if cached is None:
+            text = path.read_text(encoding='utf-8')
+            if self.doc_cache is not None:
+                doc = self.doc_cache.parse(text)
+                cached = (doc.frontmatter, doc.body)
+            else:
+                cached = extract_frontmatter(text)
+            self._fm_cache[path] = cached
+        return cached
 
     def optimize_file(self, filepath, fix=False):
         """Run all optimizations on a single file."""
@@ -990,16 +1343,17 @@ class ComprehensiveSEOOptimizer:
             'search_records': []
         }
 
-        # Read file
-        content = filepath.read_text(encoding='utf-8')
-        frontmatter, body = extract_frontmatter(content)
+        # Read and parse file once for all checks
+        text = filepath.read_text(encoding='utf-8')
+        doc = self.doc_cache.parse(text) if self.doc_cache is not None else parse_document(text)
+        frontmatter, body = doc.frontmatter, doc.body
 
         # 1. GEO Linting
-        results['geo_findings'] = geo_lint_file(filepath)
+        results['geo_findings'] = geo_lint_file(filepath, doc=doc)
         self.findings.extend(results['geo_findings'])
 
         # 1b. SEO Validation
-        seo_findings = seo_validate_file(filepath)
+        seo_findings = seo_validate_file(filepath, doc=doc)
         results['geo_findings'].extend(seo_findings)
         self.findings.extend(seo_findings)
 
@@ -1019,56 +1373,70 @@ class ComprehensiveSEOOptimizer:
 
             if results['metadata_enhanced']:
                 # Write back enhanced frontmatter
-                yaml_str = yaml.dump(enhanced_fm, default_flow_style=False, sort_keys=False)
+                yaml_str = yaml.dump(enhanced_fm, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
                 new_content = f"---\n{yaml_str}---\n{body}"
                 filepath.write_text(new_content, encoding='utf-8')
                 frontmatter = enhanced_fm
                 self.enhanced_files.append(filepath)
 
+        self._fm_cache[filepath] = (frontmatter, body)
+
         # 3. Generate SEO data
         results['seo_data'] = {
-            'structured_data': self.seo_enhancer.generate_structured_data(filepath, frontmatter, body),
+            'structured_data': self.seo_enhancer.generate_structured_data(filepath, frontmatter, body, doc=doc),
             'meta_tags': self.seo_enhancer.generate_meta_tags(frontmatter, filepath),
-            'sitemap_entry': self.seo_enhancer.generate_sitemap_entry(filepath, frontmatter)
+            'sitemap_entry': self.seo_enhancer.generate_sitemap_entry(
+                filepath, frontmatter, now=self._now, now_iso=self._now_iso
+            )
         }
 
         # 4. Generate search records
-        sections = self.algolia.extract_content_sections(body)
+        sections = self.algolia.extract_content_sections(body, doc=doc)
         for i, section in enumerate(sections):
             record = self.algolia.create_search_record(filepath, frontmatter, section, i)
             results['search_records'].append(record)
-            self.algolia.records.append(record)
+            self.algolia.add_record(record)
 
         return results
 
+    def merge_results(self, filepath, results, enhanced_files, cached=None):
+        """Fold results produced by another optimizer (e.g. a worker) into this one."""
+        self.findings.extend(results['geo_findings'])
+        for record in results['search_records']:
+            self.algolia.add_record(record)
+        self.enhanced_files.extend(enhanced_files)
+        if cached is not None:
+            self._fm_cache[filepath] = cached
+
     def generate_sitemap(self, docs_dir='docs'):
         """Generate complete sitemap.xml."""
         entries = []
 
-        for md_file in Path(docs_dir).rglob('*.md'):
-            if md_file.name.startswith('_'):
-                continue
-
-            content = md_file.read_text(encoding='utf-8')
-            frontmatter, _ = extract_frontmatter(content)
-            entry = self.seo_enhancer.generate_sitemap_entry(md_file, frontmatter)
+        for md_path in _iter_markdown_files(docs_dir):
+            md_file = Path(md_path)
+            frontmatter, _ = self._read(md_file)
+            entry = self.seo_enhancer.generate_sitemap_entry(
+                md_file, frontmatter, now=self._now, now_iso=self._now_iso
+            )
             entries.append(entry)
 
-        # Generate XML
-        xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml_content += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-
+        # Generate XML (collect lines and join once)
+        xml_lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+        ]
         for entry in sorted(entries, key=lambda x: x['priority'], reverse=True):
-            xml_content += '  <url>\n'
-            xml_content += f"    <loc>{entry['loc']}</loc>\n"
-            xml_content += f"    <lastmod>{entry['lastmod']}</lastmod>\n"
-            xml_content += f"    <changefreq>{entry['changefreq']}</changefreq>\n"
-            xml_content += f"    <priority>{entry['priority']}</priority>\n"
-            xml_content += '  </url>\n'
-
-        xml_content += '</urlset>'
-
-        Path('sitemap.xml').write_text(xml_content, encoding='utf-8')
+            xml_lines.extend((
+                '  <url>',
+                f"    <loc>{entry['loc']}</loc>",
+                f"    <lastmod>{entry['lastmod']}</lastmod>",
+                f"    <changefreq>{entry['changefreq']}</changefreq>",
+                f"    <priority>{entry['priority']}</priority>",
+                '  </url>',
+            ))
+        xml_lines.append('</urlset>')
+
+        Path('sitemap.xml').write_text('\n'.join(xml_lines), encoding='utf-8')
         print(f"Generated sitemap with {len(entries)} URLs")
         return entries
 
@@ -1097,21 +1465,49 @@ class ComprehensiveSEOOptimizer:
                 print(f"  - {f}")
 
         # Search Index Report
-        if self.algolia.records:
-            print(f"\nSearch Records: {len(self.algolia.records)} records generated")
+        if self.algolia.record_count:
+            print(f"\nSearch Records: {self.algolia.record_count} records generated")
 
             # Statistics by content type
-            types = {}
-            for r in self.algolia.records:
-                ct = r.get('content_type', 'unknown')
-                types[ct] = types.get(ct, 0) + 1
-
             print("  By content type:")
-            for t, count in sorted(types.items()):
+            for t, count in sorted(self.algolia.content_type_counts.items()):
                 print(f"    - {t}: {count}")
 
         return errors
 
+def _discard_record(record):
+    """Algolia sink used when no records payload is written."""
+
+
+# Below this many files per worker, process start-up costs more than it saves.
+_FILES_PER_WORKER = 16
+
+# Per-process optimizer, set up by the pool initializer.
+_worker_optimizer = None
+
+
+def _init_worker(base_url, cache_dir, now):
+    """Build one optimizer (and parse cache) per worker process."""
+    global _worker_optimizer
+    _worker_optimizer = ComprehensiveSEOOptimizer(
+        base_url,
+        algolia_sink=_discard_record,  # records travel back in the results
+        doc_cache=ParsedDocCache(cache_dir) if cache_dir else None,
+        now=now,
+    )
+
+
+def _optimize_one(filepath, fix):
+    """Optimize one file in a worker process and return what the parent merges."""
+    optimizer = _worker_optimizer
+    results = optimizer.optimize_file(filepath, fix=fix)
+    enhanced = optimizer.enhanced_files
+    # Reset per-file state so it does not pile up across the worker's files.
+    optimizer.enhanced_files = []
+    optimizer.findings.clear()
+    return results, enhanced, optimizer._fm_cache.pop(filepath, None)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Comprehensive SEO/GEO Optimizer for Documentation')
     parser.add_argument('path', nargs='?', default='docs',
@@ -1124,9 +1520,28 @@ def main():
                        help='Generate Algolia search records')
     parser.add_argument('--output', default='seo-output.json',
                        help='Output file for results')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                       help='Maximum worker processes for directory runs (1 = serial); '
+                            f'small runs use one process per {_FILES_PER_WORKER} files')
+    parser.add_argument('--cache-dir', default=None,
+                       help='Directory for cached parsed docs, reused across runs (e.g. .seo_cache)')
     args = parser.parse_args()
 
-    optimizer = ComprehensiveSEOOptimizer()
+    # Evict stale parse cache entries once, before any worker opens the cache.
+    doc_cache = None
+    if args.cache_dir:
+        doc_cache = ParsedDocCache(args.cache_dir)
+        doc_cache.evict()
+
+    # Records stream straight to the payload file (or are only counted when
+    # no payload is requested) rather than accumulating for the whole run.
+    algolia_stream = None
+    if args.algolia:
+        algolia_stream = AlgoliaRecordStream(args.output.replace('.json', '-algolia.json'))
+    optimizer = ComprehensiveSEOOptimizer(
+        algolia_sink=algolia_stream.write if algolia_stream else _discard_record,
+        doc_cache=doc_cache,
+    )
     path = Path(args.path)
 
     # Process files
@@ -1138,28 +1553,46 @@ def main():
             results = optimizer.optimize_file(path, fix=args.fix)
         print(json.dumps(results, indent=2, default=str))
     else:
-        for md_file in sorted(path.rglob('*.md')):
-            if md_file.name.startswith('_'):
-                continue
+        md_files = []
+        # Sort on path components to keep the same order as sorted(Path) objects
+        for md_path in sorted(_iter_markdown_files(path), key=lambda p: p.split(os.sep)):
+            md_file = Path(md_path)
             if _is_geo_ignored(md_file):
                 print(f"Skipping internal guide for GEO checks: {md_file}")
                 continue
-            print(f"Processing {md_file}...")
-            optimizer.optimize_file(md_file, fix=args.fix)
+            md_files.append(md_file)
+
+        workers = min(args.workers, len(md_files) // _FILES_PER_WORKER)
+        if workers > 1:
+            # Files are independent; workers return results and the parent
+            # merges them in sorted order so reports stay deterministic.
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(optimizer.base_url, args.cache_dir, optimizer._now),
+            ) as pool:
+                outcomes = pool.map(
+                    _optimize_one,
+                    md_files,
+                    itertools.repeat(args.fix),
+                    chunksize=_FILES_PER_WORKER,
+                )
+                for md_file, (results, enhanced, cached) in zip(md_files, outcomes):
+                    print(f"Processing {md_file}...")
+                    optimizer.merge_results(md_file, results, enhanced, cached)
+        else:
+            for md_file in md_files:
+                print(f"Processing {md_file}...")
+                optimizer.optimize_file(md_file, fix=args.fix)
 
     # Generate sitemap if requested
     if args.sitemap:
         optimizer.generate_sitemap(args.path if path.is_dir() else 'docs')
 
     # Save Algolia records if requested
-    if args.algolia:
-        algolia_data = {
-            'records': optimizer.algolia.records,
-            'config': optimizer.algolia.generate_algolia_config()
-        }
-        with open(args.output.replace('.json', '-algolia.json'), 'w') as f:
-            json.dump(algolia_data, f, indent=2, default=str)
-        print(f"Saved {len(optimizer.algolia.records)} Algolia records")
+    if algolia_stream is not None:
+        algolia_stream.close(optimizer.algolia.generate_algolia_config())
+        print(f"Saved {algolia_stream.count} Algolia records")
 
     # Generate reports
     errors = optimizer.generate_reports()
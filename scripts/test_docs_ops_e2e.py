@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-import json
+import functools
 import sys
 from pathlib import Path
 
@@ -11,17 +11,33 @@ ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from scripts import fast_json
 from scripts.check_api_sdk_drift import evaluate as evaluate_drift
 from scripts.check_docs_contract import evaluate_contract
 from scripts.evaluate_kpi_sla import evaluate as evaluate_sla
 
+# Fixture files per gate, relative to the fixtures directory. The runners open
+# exactly these names; nothing walks the directory.
+DOCS_CONTRACT_FIXTURES = ("scenario_docs_contract_block.json", "scenario_docs_contract_pass.json")
+DRIFT_FIXTURES = ("scenario_drift_block.json", "scenario_drift_pass.json")
+
 
 def _load_fixture(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+    """Load a JSON fixture; repeated loads in one process are served from memory.
+
+    The returned mapping is shared between callers and must not be mutated.
+    """
+    return _read_fixture(str(path.resolve()))
+
+
+@functools.lru_cache(maxsize=128)
+def _read_fixture(path: str) -> dict:
+    raw = Path(path).read_bytes()
+    return fast_json.loads(raw)
 
 
 def run_docs_contract_tests(fixtures_dir: Path) -> None:
-    for fixture_name in ["scenario_docs_contract_block.json", "scenario_docs_contract_pass.json"]:
+    for fixture_name in DOCS_CONTRACT_FIXTURES:
         fixture = _load_fixture(fixtures_dir / fixture_name)
         report = evaluate_contract(fixture["files"])
         actual = bool(report["blocked"])
@@ -33,7 +49,7 @@ def run_docs_contract_tests(fixtures_dir: Path) -> None:
 
 
 def run_drift_tests(fixtures_dir: Path) -> None:
-    for fixture_name in ["scenario_drift_block.json", "scenario_drift_pass.json"]:
+    for fixture_name in DRIFT_FIXTURES:
         fixture = _load_fixture(fixtures_dir / fixture_name)
         report = evaluate_drift(fixture["files"])
         if report.status != fixture["expected_status"]:
@@ -4,6 +4,9 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import difflib
+import itertools
 import json
 import sys
 import tempfile
@@ -13,10 +16,16 @@ from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
+from scripts import fast_json
 from scripts.check_api_sdk_drift import _render_markdown as render_drift_md
 from scripts.check_api_sdk_drift import evaluate as evaluate_drift
 from scripts.evaluate_kpi_sla import _render_markdown as render_sla_md
@@ -25,6 +34,8 @@ from scripts.generate_kpi_wall import build_metrics, render_dashboard_html, rend
 
 
 GOLDEN_DIR = Path("tests/golden")
+# Large goldens (the HTML dashboard) can differ on every line; keep reports readable.
+_MAX_DIFF_LINES = 200
 
 
 def _assert_equal_text(path: Path, actual: str, update: bool) -> None:
@@ -32,19 +43,62 @@ def _assert_equal_text(path: Path, actual: str, update: bool) -> None:
         path.write_text(actual, encoding="utf-8")
         return
 
-    expected = path.read_text(encoding="utf-8")
+    # Equal bytes is the common case; bytes equality checks length and then
+    # memcmp, so there is nothing to gain from hashing either side first.
+    expected_bytes = path.read_bytes()
+    if expected_bytes == actual.encode("utf-8"):
+        return
+    # Compare as text with universal newlines so a CRLF checkout still matches.
+    expected = expected_bytes.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
     if actual != expected:
-        raise AssertionError(f"Golden mismatch for {path}")
+        diff = itertools.islice(
+            difflib.unified_diff(
+                expected.splitlines(),
+                actual.splitlines(),
+                fromfile=f"{path} (golden)",
+                tofile=f"{path} (actual)",
+                lineterm="",
+            ),
+            _MAX_DIFF_LINES,
+        )
+        raise AssertionError(f"Golden mismatch for {path}\n" + "\n".join(diff))
+
+
+def _json_default(obj: Any) -> Any:
+    # Dataclasses go through here so their fields are key-sorted like every
+    # other mapping in a golden file.
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return vars(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _canonical_json(payload: Any) -> bytes:
+    """Serialize *payload* exactly as golden JSON files are written."""
+    return fast_json.dumps(payload, indent=True, sort_keys=True, default=_json_default)
 
 
-def _assert_equal_json(path: Path, actual: dict[str, Any], update: bool) -> None:
+def _assert_equal_json(path: Path, actual: Any, update: bool) -> None:
+    actual_bytes = _canonical_json(actual)
     if update:
-        path.write_text(json.dumps(actual, indent=2, sort_keys=True), encoding="utf-8")
+        path.write_bytes(actual_bytes)
         return
 
-    expected = json.loads(path.read_text(encoding="utf-8"))
-    if actual != expected:
-        raise AssertionError(f"Golden JSON mismatch for {path}")
+    # Goldens are stored in canonical form, so the common passing case is a
+    # plain byte compare; only parse when the bytes differ (e.g. a golden
+    # written with different escaping) to decide whether the data differs.
+    expected_bytes = path.read_bytes()
+    if expected_bytes == actual_bytes:
+        return
+    expected = fast_json.loads(expected_bytes)
+    if fast_json.loads(actual_bytes) != expected:
+        diff = difflib.unified_diff(
+            _canonical_json(expected).decode("utf-8").splitlines(),
+            actual_bytes.decode("utf-8").splitlines(),
+            fromfile=f"{path} (golden)",
+            tofile=f"{path} (actual)",
+            lineterm="",
+        )
+        raise AssertionError(f"Golden JSON mismatch for {path}\n" + "\n".join(diff))
 
 
 def _prepare_kpi_fixture(tmp_dir: Path) -> tuple[Path, Path]:
@@ -121,11 +175,10 @@ def _run_kpi_goldens(update: bool) -> None:
             reference_date=date(2026, 4, 15),
         )
 
-        metrics_json = metrics.__dict__
         metrics_md = render_markdown(metrics)
         metrics_html = render_dashboard_html(metrics)
 
-        _assert_equal_json(GOLDEN_DIR / "kpi_wall.json", metrics_json, update)
+        _assert_equal_json(GOLDEN_DIR / "kpi_wall.json", metrics, update)
         _assert_equal_text(GOLDEN_DIR / "kpi_wall.md", metrics_md, update)
         _assert_equal_text(GOLDEN_DIR / "wow_dashboard.html", metrics_html, update)
 
@@ -177,8 +230,16 @@ def _run_sla_goldens(update: bool) -> None:
     _assert_equal_text(GOLDEN_DIR / "kpi_sla.md", render_sla_md(report, thresholds), update)
 
 
+def _step_label(step: Any) -> str:
+    if isinstance(step, dict) and "name" in step:
+        return str(step["name"])
+    if isinstance(step, dict) and "uses" in step:
+        return f"uses:{step['uses']}"
+    return "unnamed"
+
+
 def _workflow_fingerprint(path: Path) -> dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+    data = yaml.load(path.read_bytes(), Loader=_YamlLoader)
     on_section = data.get("on", {})
 
     if isinstance(on_section, dict):
@@ -189,20 +250,10 @@ def _workflow_fingerprint(path: Path) -> dict[str, Any]:
         triggers = [str(on_section)]
 
     jobs = data.get("jobs", {})
-    job_fingerprints: dict[str, Any] = {}
-
-    for job_id, job in sorted(jobs.items()):
-        steps = job.get("steps", []) if isinstance(job, dict) else []
-        step_names = []
-        for step in steps:
-            if isinstance(step, dict) and "name" in step:
-                step_names.append(str(step["name"]))
-            elif isinstance(step, dict) and "uses" in step:
-                step_names.append(f"uses:{step['uses']}")
-            else:
-                step_names.append("unnamed")
-
-        job_fingerprints[job_id] = step_names
+    job_fingerprints = {
+        job_id: [_step_label(step) for step in (job.get("steps", []) if isinstance(job, dict) else [])]
+        for job_id, job in sorted(jobs.items())
+    }
 
     return {
         "name": data.get("name"),
@@ -4,17 +4,27 @@
 from __future__ import annotations
 
 import argparse
-import json
 import re
 from pathlib import Path
 
-UPDATED_BOX = re.compile(r"-\s*\[(x|X)\]\s*I updated documentation affected by this PR\.")
-NOT_NEEDED_BOX = re.compile(r"-\s*\[(x|X)\]\s*Documentation updates are not needed\.")
-REASON_LINE = re.compile(r"Reason\s*:\s*(.+)", re.IGNORECASE)
+try:
+    from scripts import fast_json
+except ImportError:
+    import fast_json  # type: ignore[no-redef]
+
+# All three signals in one pass. The reason alternative is a lookahead so it
+# consumes nothing and a checkbox later on the same line is still seen,
+# exactly as with three separate searches.
+DOD_CONTRACT = re.compile(
+    r"(?P<updated>-\s*\[[xX]\]\s*I updated documentation affected by this PR\.)"
+    r"|(?P<not_needed>-\s*\[[xX]\]\s*Documentation updates are not needed\.)"
+    r"|(?=(?i:reason)\s*:\s*(?P<reason>.+))"
+)
 
 
 def _load_body(event_path: Path) -> str:
-    data = json.loads(event_path.read_text(encoding="utf-8"))
+    raw = event_path.read_bytes()
+    data = fast_json.loads(raw)
     pull_request = data.get("pull_request", {})
     body = pull_request.get("body")
     if not isinstance(body, str):
@@ -22,9 +32,24 @@ def _load_body(event_path: Path) -> str:
     return body
 
 
+def _scan_contract(body: str) -> tuple[bool, bool, str | None]:
+    """Return (updated checked, not-needed checked, first reason text)."""
+    has_updated = has_not_needed = False
+    reason: str | None = None
+    for match in DOD_CONTRACT.finditer(body):
+        if match.group("updated") is not None:
+            has_updated = True
+        elif match.group("not_needed") is not None:
+            has_not_needed = True
+        elif reason is None:
+            reason = match.group("reason")
+        if has_updated and has_not_needed and reason is not None:
+            break
+    return has_updated, has_not_needed, reason
+
+
 def validate_dod(body: str) -> tuple[bool, str]:
-    has_updated = bool(UPDATED_BOX.search(body))
-    has_not_needed = bool(NOT_NEEDED_BOX.search(body))
+    has_updated, has_not_needed, reason = _scan_contract(body)
 
     if not has_updated and not has_not_needed:
         return False, "DoD contract is incomplete: select one checkbox in the PR template."
@@ -33,10 +58,9 @@ def validate_dod(body: str) -> tuple[bool, str]:
         return False, "DoD contract is invalid: select only one of the two documentation options."
 
     if has_not_needed:
-        reason_match = REASON_LINE.search(body)
-        if reason_match is None:
+        if reason is None:
             return False, "DoD contract is incomplete: provide a reason for 'docs not needed'."
-        reason_text = reason_match.group(1).strip()
+        reason_text = reason.strip()
         if len(reason_text) < 10:
             return False, "DoD contract reason is too short: provide a concrete explanation."
 
@@ -2,22 +2,40 @@
 """
 Pipeline Testing Script
 Tests all major components of the documentation pipeline
+
+File scans that passed on unchanged inputs are skipped using
+.cache/pipeline-tests.json; set PIPELINE_TEST_CACHE=0 to run everything.
 """
 
+import hashlib
+import io
+import os
+import py_compile
+import re
 import sys
 import subprocess
 import shlex
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Tuple, List
 import yaml
 import json
 
+from scripts import fast_json
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
-class _PermissiveYAMLLoader(yaml.SafeLoader):
+
+class _PermissiveYAMLLoader(_SafeLoader):
     """Safe loader that accepts unknown tags (e.g. Docker Compose !override)."""
 
 
-def _unknown_yaml_tag(loader: yaml.SafeLoader, tag_suffix: str, node: yaml.nodes.Node):
+def _unknown_yaml_tag(loader: _SafeLoader, tag_suffix: str, node: yaml.nodes.Node):
     if isinstance(node, yaml.ScalarNode):
         return loader.construct_scalar(node)
     if isinstance(node, yaml.SequenceNode):
@@ -29,9 +47,144 @@ def _unknown_yaml_tag(loader: yaml.SafeLoader, tag_suffix: str, node: yaml.nodes
 
 _PermissiveYAMLLoader.add_multi_constructor("!", _unknown_yaml_tag)
 
+_FRONTMATTER_READ_CHUNK = 8192
+# Same block as head.split(b"---", 2)[1]: from the opening --- to the next ---.
+_FRONTMATTER_RE = re.compile(rb"\A---(.*?)---", re.DOTALL)
+
+# Workflows are checked by test_github_workflows; node_modules is not ours.
+_YAML_SKIP_DIRS = frozenset({".github", "node_modules"})
+
+# Simplified JSONC handling: lines that start with // (so // inside strings
+# survives) and /* ... */ blocks, removed in a single pass over the raw bytes.
+_JSONC_COMMENT = re.compile(rb"^\s*//[^\n]*|/\*.*?\*/", re.MULTILINE | re.DOTALL)
+
+
+# Digests of file sets that passed a scan last time; see _files_digest.
+_RESULT_CACHE_PATH = Path(".cache/pipeline-tests.json")
+
+
+def _files_digest(files) -> str:
+    """Cheap signature of a file set: interpreter, paths, sizes and mtimes.
+
+    This script is part of every signature, so editing a check reruns it.
+    """
+    h = hashlib.blake2b(sys.version.encode("utf-8"), digest_size=16)
+    for path in [__file__, *sorted(str(f) for f in files)]:
+        st = os.stat(path)
+        h.update(path.encode("utf-8"))
+        h.update(st.st_size.to_bytes(8, "little"))
+        h.update(st.st_mtime_ns.to_bytes(8, "little"))
+    return h.hexdigest()
+
+
+def _load_result_cache() -> dict:
+    if os.environ.get("PIPELINE_TEST_CACHE") == "0":
+        return {}
+    try:
+        with open(_RESULT_CACHE_PATH, "rb") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _decode(output: bytes) -> str:
+    """Decode captured process output; only needed when reporting a failure."""
+    return output.decode("utf-8", errors="replace")
+
+
+def _compile_error(py_file: Path):
+    """Byte-compile one file in-process; return the error message or None."""
+    try:
+        py_compile.compile(str(py_file), doraise=True)
+    except py_compile.PyCompileError as e:
+        return e.msg
+    return None
+
+
+class _PerThreadStdout:
+    """sys.stdout stand-in that sends a capturing thread's prints to its own buffer."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (self.stream if buffer is None else buffer).write(text)
+
+    def flush(self):
+        if getattr(self._local, "buffer", None) is None:
+            self.stream.flush()
+
+    @contextmanager
+    def capture(self):
+        self._local.buffer = buffer = io.StringIO()
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = None
+
+
+def _iter_yaml(root):
+    """Yield YAML paths under root in one walk, pruning .github and node_modules."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in _YAML_SKIP_DIRS:
+                    continue
+                yield from _iter_yaml(entry.path)
+            elif entry.name.endswith((".yml", ".yaml")):
+                yield Path(entry.path)
+
+
+def _read_frontmatter_head(path: Path) -> bytes:
+    """Read a markdown file only up to the ``---`` that closes its frontmatter."""
+    head = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_FRONTMATTER_READ_CHUNK)
+            if not chunk:
+                return head
+            # Re-scan the last two bytes in case a delimiter straddles chunks.
+            start = max(3, len(head) - 2)
+            head += chunk
+            if not head.startswith(b"---") or head.find(b"---", start) != -1:
+                return head
+
+
+def _frontmatter_issues(md_file: Path) -> List[str]:
+    head = _read_frontmatter_head(md_file)
+
+    # Check frontmatter exists
+    if not head.startswith(b"---"):
+        return [f"{md_file}: Missing frontmatter"]
+
+    issues = []
+    # Extract frontmatter
+    try:
+        match = _FRONTMATTER_RE.match(head)
+        if match:
+            fm = yaml.load(match.group(1), Loader=_SafeLoader)
+
+            # Check required fields
+            if 'title' not in fm:
+                issues.append(f"{md_file}: Missing 'title' in frontmatter")
+            if 'description' not in fm:
+                issues.append(f"{md_file}: Missing 'description' in frontmatter")
+            if 'content_type' not in fm:
+                issues.append(f"{md_file}: Missing 'content_type' in frontmatter")
+
+    except (Exception,) as e:
+        issues.append(f"{md_file}: Invalid frontmatter - {e}")
+    return issues
+
 
 def _yaml_load(path: Path):
-    with open(path, "r", encoding="utf-8") as f:
+    with open(path, "rb") as f:
         return yaml.load(f, Loader=_PermissiveYAMLLoader)
 
 
@@ -42,20 +195,42 @@ class PipelineTestRunner:
         self.root_dir = Path(__file__).parent
         self.test_results = []
         self.failed_tests = []
-
-    def run_command(self, command: str, cwd: str = None) -> Tuple[int, str, str]:
-        """Execute command and return exit code, stdout, stderr"""
+        self._lock = threading.Lock()
+        self._result_cache = _load_result_cache()
+        self._cache_dirty = False
+
+    def _passed_before(self, key: str, digest: str) -> bool:
+        """True when this exact file set passed the scan on a previous run."""
+        return self._result_cache.get(key) == digest
+
+    def _record_pass(self, key: str, digest: str) -> None:
+        with self._lock:
+            self._result_cache[key] = digest
+            self._cache_dirty = True
+
+    def _save_result_cache(self) -> None:
+        if not self._cache_dirty or os.environ.get("PIPELINE_TEST_CACHE") == "0":
+            return
+        try:
+            _RESULT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _RESULT_CACHE_PATH.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self._result_cache, indent=2, sort_keys=True), encoding="utf-8")
+            os.replace(tmp_path, _RESULT_CACHE_PATH)
+        except OSError:
+            pass
+
+    def run_command(self, command: str, cwd: str = None) -> Tuple[int, bytes, bytes]:
+        """Execute command and return exit code, raw stdout, raw stderr"""
         try:
             cmd_parts = shlex.split(command)
             result = subprocess.run(
                 cmd_parts,
                 capture_output=True,
-                text=True,
                 cwd=cwd or self.root_dir
             )
             return result.returncode, result.stdout, result.stderr
         except (Exception,) as e:
-            return 1, "", str(e)
+            return 1, b"", str(e).encode("utf-8")
 
     def test_python_scripts_syntax(self) -> bool:
         """Test that all Python scripts have valid syntax"""
@@ -64,12 +239,19 @@ class PipelineTestRunner:
         python_files = list(Path("scripts").glob("*.py"))
         python_files.extend(Path(".github/workflows").glob("*.py"))
 
+        digest = _files_digest(python_files)
+        if self._passed_before("python_syntax", digest):
+            print(f"✅ All {len(python_files)} Python scripts unchanged since last passing run")
+            return True
+
+        # Compile in this interpreter instead of one python3 process per file.
         for py_file in python_files:
-            code, _, err = self.run_command(f'python3 -m py_compile "{py_file}"')
-            if code != 0:
+            err = _compile_error(py_file)
+            if err is not None:
                 self.failed_tests.append(f"Syntax error in {py_file}: {err}")
                 return False
 
+        self._record_pass("python_syntax", digest)
         print(f"✅ All {len(python_files)} Python scripts have valid syntax")
         return True
 
@@ -77,19 +259,21 @@ class PipelineTestRunner:
         """Test that all YAML files are valid"""
         print("\n🔍 Testing YAML files...")
 
-        yaml_files = list(self.root_dir.glob("**/*.yml"))
-        yaml_files.extend(self.root_dir.glob("**/*.yaml"))
+        yaml_files = list(_iter_yaml(self.root_dir))
 
-        for yaml_file in yaml_files:
-            if ".github" in str(yaml_file) or "node_modules" in str(yaml_file):
-                continue
+        digest = _files_digest(yaml_files)
+        if self._passed_before("yaml_files", digest):
+            print(f"✅ All {len(yaml_files)} YAML files unchanged since last passing run")
+            return True
 
+        for yaml_file in yaml_files:
             try:
                 _yaml_load(yaml_file)
             except (Exception,) as e:
                 self.failed_tests.append(f"Invalid YAML in {yaml_file}: {e}")
                 return False
 
+        self._record_pass("yaml_files", digest)
         print(f"✅ All {len(yaml_files)} YAML files are valid")
         return True
 
@@ -100,7 +284,7 @@ class PipelineTestRunner:
         code, out, err = self.run_command("python3 scripts/validate_frontmatter.py")
 
         if code != 0:
-            self.failed_tests.append(f"Frontmatter validation failed: {err}")
+            self.failed_tests.append(f"Frontmatter validation failed: {_decode(err)}")
             return False
 
         print("✅ Frontmatter validation working")
@@ -114,14 +298,14 @@ class PipelineTestRunner:
         code, out, err = self.run_command("python3 scripts/seo_geo_optimizer.py docs/ --help")
 
         if code != 0:
-            self.failed_tests.append(f"SEO optimizer failed: {err}")
+            self.failed_tests.append(f"SEO optimizer failed: {_decode(err)}")
             return False
 
         # Test actual run
         code, out, err = self.run_command("python3 scripts/seo_geo_optimizer.py docs/")
 
-        if "error" in err.lower() and "no blocking errors" not in out.lower():
-            self.failed_tests.append(f"SEO optimizer found errors: {err}")
+        if b"error" in err.lower() and b"no blocking errors" not in out.lower():
+            self.failed_tests.append(f"SEO optimizer found errors: {_decode(err)}")
             return False
 
         print("✅ SEO/GEO optimizer working")
@@ -134,7 +318,7 @@ class PipelineTestRunner:
         code, out, err = self.run_command("python3 scripts/lifecycle_manager.py --scan")
 
         if code != 0:
-            self.failed_tests.append(f"Lifecycle manager failed: {err}")
+            self.failed_tests.append(f"Lifecycle manager failed: {_decode(err)}")
             return False
 
         print("✅ Lifecycle manager working")
@@ -155,11 +339,10 @@ class PipelineTestRunner:
             config = _yaml_load(mkdocs_file)
 
             # Check required sections
-            required = ['site_name', 'theme', 'plugins', 'nav']
-            for req in required:
-                if req not in config:
-                    self.failed_tests.append(f"Missing required section in mkdocs.yml: {req}")
-                    return False
+            missing = {'site_name', 'theme', 'plugins', 'nav'} - config.keys()
+            if missing:
+                self.failed_tests.append(f"Missing required sections in mkdocs.yml: {sorted(missing)}")
+                return False
 
         except (Exception,) as e:
             self.failed_tests.append(f"Invalid mkdocs.yml: {e}")
@@ -181,11 +364,10 @@ class PipelineTestRunner:
             variables = _yaml_load(var_file)
 
             # Check key variables exist
-            required_vars = ['product_name', 'default_port', 'cloud_url']
-            for var in required_vars:
-                if var not in variables:
-                    self.failed_tests.append(f"Missing variable: {var}")
-                    return False
+            missing = {'product_name', 'default_port', 'cloud_url'} - variables.keys()
+            if missing:
+                self.failed_tests.append(f"Missing variables: {sorted(missing)}")
+                return False
 
         except (Exception,) as e:
             self.failed_tests.append(f"Invalid variables file: {e}")
@@ -205,31 +387,15 @@ class PipelineTestRunner:
 
         try:
             # VS Code uses JSONC (JSON with Comments), so we need to strip comments
-            with open(snippets_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # Simple comment removal for JSONC
-            import re
-            # Remove single-line comments (but not // inside strings)
-            # This is a simplified approach - just remove lines that start with //
-            lines = content.split('\n')
-            cleaned_lines = []
-            for line in lines:
-                stripped = line.strip()
-                if not stripped.startswith('//'):
-                    cleaned_lines.append(line)
-            content = '\n'.join(cleaned_lines)
-            # Remove multi-line comments
-            content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
-
-            snippets = json.loads(content)
+            content = _JSONC_COMMENT.sub(b'', snippets_file.read_bytes())
+
+            snippets = fast_json.loads(content)
 
             # Check that key snippets exist
-            required_snippets = ['Tutorial Document', 'How-To Guide']
-            for snippet in required_snippets:
-                if snippet not in snippets:
-                    self.failed_tests.append(f"Missing snippet: {snippet}")
-                    return False
+            missing = {'Tutorial Document', 'How-To Guide'} - snippets.keys()
+            if missing:
+                self.failed_tests.append(f"Missing snippets: {sorted(missing)}")
+                return False
 
         except (Exception,) as e:
             self.failed_tests.append(f"Invalid snippets file: {e}")
@@ -244,6 +410,11 @@ class PipelineTestRunner:
 
         workflow_files = list(Path(".github/workflows").glob("*.yml"))
 
+        digest = _files_digest(workflow_files)
+        if self._passed_before("github_workflows", digest):
+            print(f"✅ All {len(workflow_files)} GitHub workflows unchanged since last passing run")
+            return True
+
         for workflow in workflow_files:
             try:
                 config = _yaml_load(workflow)
@@ -262,6 +433,7 @@ class PipelineTestRunner:
                 self.failed_tests.append(f"Invalid workflow {workflow}: {e}")
                 return False
 
+        self._record_pass("github_workflows", digest)
         print(f"✅ All {len(workflow_files)} GitHub workflows valid")
         return True
 
@@ -272,33 +444,15 @@ class PipelineTestRunner:
         md_files = list(Path("docs").rglob("*.md"))
         issues = []
 
-        for md_file in md_files:
-            if md_file.name.startswith("_"):
-                continue
+        doc_files = [f for f in md_files if not f.name.startswith("_")]
+        digest = _files_digest(doc_files)
+        if self._passed_before("documentation_files", digest):
+            print(f"✅ All {len(md_files)} documentation files unchanged since last passing run")
+            return True
 
-            content = md_file.read_text(encoding='utf-8')
-
-            # Check frontmatter exists
-            if not content.startswith("---"):
-                issues.append(f"{md_file}: Missing frontmatter")
-                continue
-
-            # Extract frontmatter
-            try:
-                parts = content.split("---", 2)
-                if len(parts) >= 3:
-                    fm = yaml.safe_load(parts[1])
-
-                    # Check required fields
-                    if 'title' not in fm:
-                        issues.append(f"{md_file}: Missing 'title' in frontmatter")
-                    if 'description' not in fm:
-                        issues.append(f"{md_file}: Missing 'description' in frontmatter")
-                    if 'content_type' not in fm:
-                        issues.append(f"{md_file}: Missing 'content_type' in frontmatter")
-
-            except (Exception,) as e:
-                issues.append(f"{md_file}: Invalid frontmatter - {e}")
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for file_issues in executor.map(_frontmatter_issues, doc_files):
+                issues.extend(file_issues)
 
         if issues:
             for issue in issues[:5]:  # Show first 5 issues
@@ -307,9 +461,21 @@ class PipelineTestRunner:
                 print(f"  ... and {len(issues) - 5} more issues")
             return False
 
+        self._record_pass("documentation_files", digest)
         print(f"✅ All {len(md_files)} documentation files valid")
         return True
 
+    def _run_captured(self, stdout: _PerThreadStdout, test_name: str, test_func) -> Tuple[str, str]:
+        """Run one check with its prints buffered; return (result, output)."""
+        with stdout.capture() as buffer:
+            try:
+                result = "PASSED" if test_func() else "FAILED"
+            except (Exception,) as e:
+                result = f"ERROR: {e}"
+                with self._lock:
+                    self.failed_tests.append(f"{test_name}: {e}")
+        return result, buffer.getvalue()
+
     def run_all_tests(self) -> bool:
         """Run all tests and report results"""
         print("="*60)
@@ -329,21 +495,38 @@ class PipelineTestRunner:
             ("Documentation Files", self.test_documentation_files),
         ]
 
+        # The checks touch disjoint files and mostly wait on I/O or child
+        # processes, so run them together. Each one's output is buffered and
+        # printed in declaration order once all have finished.
+        stdout = _PerThreadStdout(sys.stdout)
+        sys.stdout = stdout
+        try:
+            workers = min(len(tests), (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self._run_captured, stdout, test_name, test_func)
+                    for test_name, test_func in tests
+                ]
+        finally:
+            sys.stdout = stdout.stream
+
+        outcomes = {}
+        for (test_name, _), future in zip(tests, futures):
+            outcomes[test_name], output = future.result()
+            sys.stdout.write(output)
+
         passed = 0
         failed = 0
 
-        for test_name, test_func in tests:
-            try:
-                if test_func():
-                    passed += 1
-                    self.test_results.append((test_name, "PASSED"))
-                else:
-                    failed += 1
-                    self.test_results.append((test_name, "FAILED"))
-            except (Exception,) as e:
+        for test_name, _ in tests:
+            result = outcomes[test_name]
+            if result == "PASSED":
+                passed += 1
+            else:
                 failed += 1
-                self.test_results.append((test_name, f"ERROR: {e}"))
-                self.failed_tests.append(f"{test_name}: {e}")
+            self.test_results.append((test_name, result))
+
+        self._save_result_cache()
 
         # Print summary
         print("\n" + "="*60)
@@ -3,24 +3,22 @@
 
 from __future__ import annotations
 
+import io
 import json
+import os
+import re
 import subprocess
+import sys
 import tempfile
 import time
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import patch
 from datetime import date
 from pathlib import Path
 
 import yaml
 
-from scripts.check_api_sdk_drift import evaluate as evaluate_drift
-from scripts.check_code_examples_smoke import _parse_blocks, _run_smoke_block, run_smoke
-from scripts.check_docs_contract import evaluate_contract
-from scripts.evaluate_kpi_sla import evaluate as evaluate_sla
-from scripts.generate_kpi_wall import build_metrics
-from scripts.test_docs_ops_e2e import run_docs_contract_tests, run_drift_tests, run_sla_tests
-
 # Docusaurus adapter & GUI configurator tests
 from test_docusaurus_adapter import (
     AdmonitionConversionTests,
@@ -35,29 +33,44 @@ from test_gui_configurator import ConfiguratorGenerationTests
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 SCRIPTS_DIR = ROOT_DIR / "scripts"
+SECRET_MARKERS = (b"sk_live_", b"sk_test_", b"AKIA", b"ghp_", b"xoxb-")
+# One alternation of escaped literals finds any marker in a single pass.
+SECRET_MARKER_RE = re.compile(b"|".join(re.escape(marker) for marker in SECRET_MARKERS))
 
 
 class FunctionalTests(unittest.TestCase):
     """Validate core business logic for docs contract, drift, KPI, and SLA."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Script imports are bound per class so selecting one class with -k
+        # only imports the scripts it exercises.
+        from scripts.check_api_sdk_drift import evaluate as evaluate_drift
+        from scripts.check_docs_contract import evaluate_contract
+        from scripts.evaluate_kpi_sla import evaluate as evaluate_sla
+
+        cls.evaluate_contract = staticmethod(evaluate_contract)
+        cls.evaluate_drift = staticmethod(evaluate_drift)
+        cls.evaluate_sla = staticmethod(evaluate_sla)
+
     def test_docs_contract_blocks_without_docs(self) -> None:
         files = ["api/openapi.yaml", "src/app/routes/orders.py"]
-        report = evaluate_contract(files)
+        report = self.evaluate_contract(files)
         self.assertTrue(report["blocked"])
 
     def test_docs_contract_passes_with_docs(self) -> None:
         files = ["api/openapi.yaml", "docs/reference/orders.md"]
-        report = evaluate_contract(files)
+        report = self.evaluate_contract(files)
         self.assertFalse(report["blocked"])
 
     def test_drift_detected_without_reference_docs(self) -> None:
         files = ["api/openapi.yaml", "sdk/client.ts"]
-        report = evaluate_drift(files)
+        report = self.evaluate_drift(files)
         self.assertEqual(report.status, "drift")
 
     def test_drift_passes_with_reference_docs(self) -> None:
         files = ["api/openapi.yaml", "docs/reference/orders.md"]
-        report = evaluate_drift(files)
+        report = self.evaluate_drift(files)
         self.assertEqual(report.status, "ok")
 
     def test_sla_breach_for_low_quality(self) -> None:
@@ -69,7 +82,7 @@ class FunctionalTests(unittest.TestCase):
             "max_high_priority_gaps": 8,
             "max_quality_score_drop": 5,
         }
-        report = evaluate_sla(current, previous, thresholds)
+        report = self.evaluate_sla(current, previous, thresholds)
         self.assertEqual(report.status, "breach")
         self.assertGreaterEqual(len(report.breaches), 3)
 
@@ -77,16 +90,32 @@ class FunctionalTests(unittest.TestCase):
 class IntegrationTests(unittest.TestCase):
     """Validate cross-script behavior with realistic generated artifacts."""
 
-    def test_kpi_output_is_consumed_by_sla_evaluation(self) -> None:
-        with tempfile.TemporaryDirectory() as temp:
-            tmp_path = Path(temp)
-            docs_dir = tmp_path / "docs"
-            reports_dir = tmp_path / "reports"
-            docs_dir.mkdir(parents=True, exist_ok=True)
-            reports_dir.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def setUpClass(cls) -> None:
+        from scripts.evaluate_kpi_sla import main as sla_main
+        from scripts.generate_kpi_wall import build_metrics
+
+        cls.build_metrics = staticmethod(build_metrics)
+        cls.sla_main = staticmethod(sla_main)
+
+        # One scratch directory per class; each test works in its own subdir.
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmp_root = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp.cleanup()
 
-            (docs_dir / "service.md").write_text(
-                """---
+    def test_kpi_output_is_consumed_by_sla_evaluation(self) -> None:
+        tmp_path = self.tmp_root / self._testMethodName
+        tmp_path.mkdir()
+        docs_dir = tmp_path / "docs"
+        reports_dir = tmp_path / "reports"
+        docs_dir.mkdir(parents=True, exist_ok=True)
+        reports_dir.mkdir(parents=True, exist_ok=True)
+
+        (docs_dir / "service.md").write_text(
+            """---
 title: Service
 description: Service documentation page.
 content_type: reference
@@ -96,57 +125,53 @@ last_reviewed: '2026-01-01'
 # Service
 Integration test page.
 """,
-                encoding="utf-8",
-            )
+            encoding="utf-8",
+        )
 
-            metrics = build_metrics(
-                docs_dir=docs_dir,
-                reports_dir=reports_dir,
-                stale_days=90,
-                generated_at="2026-02-18T00:00:00Z",
-                reference_date=date(2026, 4, 15),
-            )
+        metrics = self.build_metrics(
+            docs_dir=docs_dir,
+            reports_dir=reports_dir,
+            stale_days=90,
+            generated_at="2026-02-18T00:00:00Z",
+            reference_date=date(2026, 4, 15),
+        )
 
-            current_path = reports_dir / "kpi-wall.json"
-            current_path.write_text(json.dumps(metrics.__dict__), encoding="utf-8")
-
-            policy_path = tmp_path / "policy.yml"
-            policy_path.write_text(
-                json.dumps(
-                    {
-                        "kpi_sla": {
-                            "min_quality_score": 0,
-                            "max_stale_pct": 100.0,
-                            "max_high_priority_gaps": 100,
-                            "max_quality_score_drop": 100,
-                        }
+        current_path = reports_dir / "kpi-wall.json"
+        current_path.write_text(json.dumps(metrics.__dict__), encoding="utf-8")
+
+        policy_path = tmp_path / "policy.yml"
+        policy_path.write_text(
+            json.dumps(
+                {
+                    "kpi_sla": {
+                        "min_quality_score": 0,
+                        "max_stale_pct": 100.0,
+                        "max_high_priority_gaps": 100,
+                        "max_quality_score_drop": 100,
                     }
-                ),
-                encoding="utf-8",
-            )
+                }
+            ),
+            encoding="utf-8",
+        )
 
-            json_out = reports_dir / "kpi-sla-report.json"
-            md_out = reports_dir / "kpi-sla-report.md"
-            cmd = [
-                "python3",
-                str(SCRIPTS_DIR / "evaluate_kpi_sla.py"),
-                "--current",
-                str(current_path),
-                "--policy-pack",
-                str(policy_path),
-                "--json-output",
-                str(json_out),
-                "--md-output",
-                str(md_out),
-            ]
-            completed = subprocess.run(cmd, cwd=ROOT_DIR, capture_output=True, text=True, check=False)
-            self.assertEqual(
-                completed.returncode,
-                0,
-                msg=f"SLA CLI should pass in integration test. stderr={completed.stderr}",
-            )
-            self.assertTrue(json_out.exists())
-            self.assertTrue(md_out.exists())
+        json_out = reports_dir / "kpi-sla-report.json"
+        md_out = reports_dir / "kpi-sla-report.md"
+        argv = [
+            "evaluate_kpi_sla.py",
+            "--current",
+            str(current_path),
+            "--policy-pack",
+            str(policy_path),
+            "--json-output",
+            str(json_out),
+            "--md-output",
+            str(md_out),
+        ]
+        with patch.object(sys, "argv", argv), redirect_stdout(io.StringIO()):
+            exit_code = self.sla_main()
+        self.assertEqual(exit_code, 0, msg="SLA CLI should pass in integration test.")
+        self.assertTrue(json_out.exists())
+        self.assertTrue(md_out.exists())
 
     def test_lifecycle_manager_generates_report_and_json(self) -> None:
         cmd = [
@@ -174,27 +199,31 @@ Integration test page.
 class SecurityTests(unittest.TestCase):
     """Validate basic secure coding constraints for pipeline scripts."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Both source scans share one read of every script. The markers are
+        # ASCII, so the raw bytes are searched without decoding.
+        cls.script_sources = [(path, path.read_bytes()) for path in sorted(SCRIPTS_DIR.glob("*.py"))]
+
     def test_no_shell_true_in_subprocess_calls(self) -> None:
         # multi_protocol_engine.py uses shell=True intentionally for
         # repo-owner-configured hook commands (code_first_schema_export_cmd
         # etc.) that legitimately require shell features (redirection, &&).
         allowed = {"multi_protocol_engine.py"}
         offenders: list[str] = []
-        for path in sorted(SCRIPTS_DIR.glob("*.py")):
+        for path, source in self.script_sources:
             if path.name in allowed:
                 continue
-            text = path.read_text(encoding="utf-8", errors="ignore")
-            if "subprocess.run(" in text and "shell=True" in text:
+            if b"subprocess.run(" in source and b"shell=True" in source:
                 offenders.append(str(path))
         self.assertEqual(offenders, [], msg=f"Found shell=True in: {offenders}")
 
     def test_no_inline_secret_literals_in_scripts(self) -> None:
-        patterns = ("sk_live_", "sk_test_", "AKIA", "ghp_", "xoxb-")
         offenders: list[str] = []
-        for path in sorted(SCRIPTS_DIR.glob("*.py")):
-            text = path.read_text(encoding="utf-8", errors="ignore")
-            if any(pattern in text for pattern in patterns):
-                offenders.append(str(path))
+        for path, source in self.script_sources:
+            match = SECRET_MARKER_RE.search(source)
+            if match:
+                offenders.append(f"{path} ({match.group().decode()})")
         self.assertEqual(offenders, [], msg=f"Possible hardcoded secret markers in: {offenders}")
 
     def test_lifecycle_workflow_has_guardrails(self) -> None:
@@ -217,18 +246,34 @@ class SecurityTests(unittest.TestCase):
 class PerformanceTests(unittest.TestCase):
     """Validate core checks stay within practical runtime budgets."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        from scripts.check_api_sdk_drift import evaluate as evaluate_drift
+        from scripts.check_code_examples_smoke import _parse_blocks
+        from scripts.check_docs_contract import evaluate_contract
+
+        cls.evaluate_contract = staticmethod(evaluate_contract)
+        cls.evaluate_drift = staticmethod(evaluate_drift)
+        cls.parse_blocks = staticmethod(_parse_blocks)
+
+        # Both evaluators scan the list several times, so it stays a list;
+        # building it once keeps the f-string work out of the timed tests.
+        cls.large_change_set = [
+            *(f"src/service/module_{i}.py" for i in range(12000)),
+            *(f"api/spec_{i}.yaml" for i in range(3000)),
+            *(f"sdk/client_{i}.ts" for i in range(3000)),
+            *(f"docs/reference/endpoint_{i}.md" for i in range(2000)),
+        ]
+
     def test_contract_and_drift_scale_to_large_change_sets(self) -> None:
-        files = [f"src/service/module_{i}.py" for i in range(12000)]
-        files.extend(f"api/spec_{i}.yaml" for i in range(3000))
-        files.extend(f"sdk/client_{i}.ts" for i in range(3000))
-        files.extend(f"docs/reference/endpoint_{i}.md" for i in range(2000))
+        files = self.large_change_set
 
         start = time.perf_counter()
-        contract_report = evaluate_contract(files)
+        contract_report = self.evaluate_contract(files)
         contract_elapsed = time.perf_counter() - start
 
         start = time.perf_counter()
-        drift_report = evaluate_drift(files)
+        drift_report = self.evaluate_drift(files)
         drift_elapsed = time.perf_counter() - start
 
         self.assertFalse(contract_report["blocked"])
@@ -244,7 +289,7 @@ class PerformanceTests(unittest.TestCase):
             doc_path.write_text("# Large\n\n" + block * 2000, encoding="utf-8")
 
             start = time.perf_counter()
-            blocks = _parse_blocks(doc_path)
+            blocks = self.parse_blocks(doc_path)
             elapsed = time.perf_counter() - start
 
             self.assertEqual(len(blocks), 2000)
@@ -254,11 +299,19 @@ class PerformanceTests(unittest.TestCase):
 class E2ETests(unittest.TestCase):
     """Validate full fixture-driven behavior from existing E2E checks."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        from scripts.test_docs_ops_e2e import run_docs_contract_tests, run_drift_tests, run_sla_tests
+
+        cls.run_docs_contract_tests = staticmethod(run_docs_contract_tests)
+        cls.run_drift_tests = staticmethod(run_drift_tests)
+        cls.run_sla_tests = staticmethod(run_sla_tests)
+
     def test_fixture_driven_e2e_suite(self) -> None:
         fixtures_dir = ROOT_DIR / "tests" / "fixtures" / "docs_ops"
-        run_docs_contract_tests(fixtures_dir)
-        run_drift_tests(fixtures_dir)
-        run_sla_tests()
+        self.run_docs_contract_tests(fixtures_dir)
+        self.run_drift_tests(fixtures_dir)
+        self.run_sla_tests()
 
 
 class WorkflowContractTests(unittest.TestCase):
@@ -276,22 +329,46 @@ class WorkflowContractTests(unittest.TestCase):
             ".github/workflows/lifecycle-management.yml",
             ".github/workflows/openapi-source-sync.yml",
         ]
-        missing = [path for path in required if not (ROOT_DIR / path).exists()]
+        # One directory listing per parent instead of a stat per file.
+        listings: dict[str, set[str]] = {}
+        for path in required:
+            parent = os.path.dirname(path)
+            if parent not in listings:
+                try:
+                    listings[parent] = set(os.listdir(ROOT_DIR / parent))
+                except FileNotFoundError:
+                    listings[parent] = set()
+        missing = [path for path in required if os.path.basename(path) not in listings[os.path.dirname(path)]]
         self.assertEqual(missing, [], msg=f"Missing workflow files: {missing}")
 
 
 class CodeExamplesSmokeTests(unittest.TestCase):
     """Validate smoke runner behavior on markdown code examples."""
 
+    @classmethod
+    def setUpClass(cls) -> None:
+        from scripts.check_code_examples_smoke import _run_smoke_block, run_smoke
+
+        cls.run_smoke = staticmethod(run_smoke)
+        cls.run_smoke_block = staticmethod(_run_smoke_block)
+
+        # One scratch directory per class; each test works in its own subdir.
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.tmp_root = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._tmp.cleanup()
+
     def test_smoke_runner_executes_tagged_examples(self) -> None:
-        with tempfile.TemporaryDirectory() as temp:
-            tmp_path = Path(temp)
-            docs_dir = tmp_path / "docs"
-            docs_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.tmp_root / self._testMethodName
+        tmp_path.mkdir()
+        docs_dir = tmp_path / "docs"
+        docs_dir.mkdir(parents=True, exist_ok=True)
 
-            smoke_doc = docs_dir / "smoke.md"
-            smoke_doc.write_text(
-                """# Smoke example
+        smoke_doc = docs_dir / "smoke.md"
+        smoke_doc.write_text(
+            """# Smoke example
 
 ```python smoke
 print("ok")
@@ -301,16 +378,16 @@ print("ok")
 {"service":"docs","status":"ok"}
 ```
 """,
-                encoding="utf-8",
-            )
+            encoding="utf-8",
+        )
 
-            result = run_smoke(paths=[str(docs_dir)], timeout=8, allow_empty=False, allow_network=False)
-            self.assertEqual(result, 0)
+        result = self.run_smoke(paths=[str(docs_dir)], timeout=8, allow_empty=False, allow_network=False)
+        self.assertEqual(result, 0)
 
     def test_smoke_runner_handles_curl_without_network_execution(self) -> None:
         block_content = 'curl -X GET "https://example.com/health"'
         with patch("scripts.check_code_examples_smoke.shutil.which", return_value="/usr/bin/curl"):
-            ok, reason = _run_smoke_block(
+            ok, reason = self.run_smoke_block(
                 block=type("B", (), {"language": "curl", "content": block_content, "tags": {"smoke"}})(),
                 timeout=5,
                 allow_network=False,
@@ -322,12 +399,12 @@ print("ok")
         go_block = type("B", (), {"language": "go", "content": "package main\nfunc main() {}", "tags": {"smoke"}})()
 
         with patch("scripts.check_code_examples_smoke._run_typescript", return_value=(True, "")) as ts_runner:
-            ok_ts, _ = _run_smoke_block(ts_block, timeout=5, allow_network=False)
+            ok_ts, _ = self.run_smoke_block(ts_block, timeout=5, allow_network=False)
             self.assertTrue(ok_ts)
             ts_runner.assert_called_once()
 
         with patch("scripts.check_code_examples_smoke._run_go", return_value=(True, "")) as go_runner:
-            ok_go, _ = _run_smoke_block(go_block, timeout=5, allow_network=False)
+            ok_go, _ = self.run_smoke_block(go_block, timeout=5, allow_network=False)
             self.assertTrue(ok_go)
             go_runner.assert_called_once()
 
@@ -0,0 +1,56 @@
+"""Tests for scripts/fast_json.py."""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import date
+from typing import Any
+
+import pytest
+
+from scripts import fast_json
+
+
+@dataclasses.dataclass
+class _Point:
+    y: int
+    x: int
+
+
+def _default(obj: Any) -> Any:
+    if dataclasses.is_dataclass(obj):
+        return vars(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(type(obj).__name__)
+
+
+PAYLOAD = {"b": [1, 2.5, None, True], "a": {"name": "Grüße", "point": _Point(2, 1), "day": date(2026, 1, 2)}}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return request.param
+
+
+class TestFastJson:
+    """Both backends must produce the same bytes."""
+
+    def test_compact_output(self, backend: str) -> None:
+        assert fast_json.dumps({"a": [1, "x"]}) == b'{"a":[1,"x"]}'
+
+    def test_indented_sorted_output(self, backend: str) -> None:
+        expected = (
+            '{\n  "a": {\n    "day": "2026-01-02",\n    "name": "Grüße",\n'
+            '    "point": {\n      "x": 1,\n      "y": 2\n    }\n  },\n'
+            '  "b": [\n    1,\n    2.5,\n    null,\n    true\n  ]\n}'
+        )
+        assert fast_json.dumps(PAYLOAD, indent=True, sort_keys=True, default=_default) == expected.encode("utf-8")
+
+    def test_loads_bytes_and_text(self, backend: str) -> None:
+        assert fast_json.loads(b'{"a": [1]}') == {"a": [1]}
+        assert fast_json.loads('{"a": "\\u00fc"}') == {"a": "ü"}
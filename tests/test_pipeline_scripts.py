@@ -8,6 +8,8 @@ Covers pure logic functions in:
 - gap_detection/cli.py (argument parsing)
 - generate_kpi_wall.py (render_dashboard_html, _compute_quality_score)
 - check_code_examples_smoke.py (parse_smoke_tag, run_smoke_check)
+- test_golden_reports_and_workflows.py (_workflow_fingerprint)
+- test_pipeline.py (PipelineTestRunner.test_github_workflows, run_all_tests)
 """
 
 from __future__ import annotations
@@ -398,3 +400,90 @@ class TestEvaluateKpiSlaDeep:
         }
         report = evaluate(current, {}, thresholds)
         assert report.status == "ok"
+
+
+# ===========================================================================
+# test_golden_reports_and_workflows.py
+# ===========================================================================
+
+
+class TestWorkflowFingerprint:
+    """Tests for the workflow golden fingerprint."""
+
+    def test_merge_keys_are_resolved(self, tmp_path: Path) -> None:
+        from scripts.test_golden_reports_and_workflows import _workflow_fingerprint
+
+        workflow = tmp_path / "ci.yml"
+        workflow.write_text(
+            "name: CI\n"
+            "<<: {'on': {push: {}}}\n"
+            "jobs:\n"
+            "  build:\n"
+            "    <<: {runs-on: ubuntu-latest}\n"
+            "    steps:\n"
+            "      - {name: Checkout, uses: actions/checkout@v4}\n"
+            "      - uses: actions/setup-python@v5\n"
+            "      - run: make\n",
+            encoding="utf-8",
+        )
+
+        assert _workflow_fingerprint(workflow) == {
+            "name": "CI",
+            "triggers": ["push"],
+            "jobs": {"build": ["Checkout", "uses:actions/setup-python@v5", "unnamed"]},
+        }
+
+
+# ===========================================================================
+# test_pipeline.py
+# ===========================================================================
+
+
+class TestPipelineWorkflowCheck:
+    """Tests for PipelineTestRunner.test_github_workflows."""
+
+    def test_accepts_top_level_merge_key(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        from test_pipeline import PipelineTestRunner
+
+        workflows = tmp_path / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "ci.yml").write_text(
+            "name: CI\non: push\n<<: {jobs: {}}\n",
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("PIPELINE_TEST_CACHE", "0")
+
+        runner = PipelineTestRunner()
+        assert runner.test_github_workflows() is True
+        assert runner.failed_tests == []
+
+    def test_run_all_tests_does_not_interleave_output(
+        self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        import time
+
+        from test_pipeline import PipelineTestRunner
+
+        monkeypatch.setenv("PIPELINE_TEST_CACHE", "0")
+        runner = PipelineTestRunner()
+        names = [name for name in dir(runner) if name.startswith("test_") and callable(getattr(runner, name))]
+
+        def make_check(delay: float, name: str) -> Any:
+            def check() -> bool:
+                print(f"start {name}")
+                time.sleep(delay)
+                print(f"end {name}")
+                return True
+
+            return check
+
+        # Checks finish in the reverse of their start order.
+        for index, name in enumerate(names):
+            monkeypatch.setattr(runner, name, make_check(0.01 * (len(names) - index), name))
+
+        assert runner.run_all_tests() is True
+        out = capsys.readouterr().out
+        lines = [line for line in out.splitlines() if line.startswith(("start ", "end "))]
+        assert lines[0::2] == [line.replace("end ", "start ") for line in lines[1::2]]
+        assert sorted(line.split()[1] for line in lines[0::2]) == sorted(names)
@@ -393,6 +393,17 @@ class TestValidatePrDod:
         assert ok is False
         assert "too short" in message
 
+    def test_checkbox_after_reason_on_same_line_is_seen(self) -> None:
+        from scripts.validate_pr_dod import validate_dod
+
+        body = (
+            "- [x] Documentation updates are not needed.\n"
+            "Reason: covered elsewhere - [x] I updated documentation affected by this PR.\n"
+        )
+        ok, message = validate_dod(body)
+        assert ok is False
+        assert "invalid" in message
+
     def test_load_body(self, tmp_path: Path) -> None:
         from scripts.validate_pr_dod import _load_body
 
@@ -521,6 +532,16 @@ class TestCheckDocsContract:
         assert _matches_any("api/openapi.yaml", (r"^api/",)) is True
         assert _matches_any("src/index.ts", (r"^api/",)) is False
 
+    def test_matches_any_edge_patterns(self) -> None:
+        from scripts.check_docs_contract import _matches_any
+
+        assert _matches_any("api/openapi.yaml", ()) is False
+        # Backreferences cannot share one alternation; they are searched alone.
+        assert _matches_any("docs/aa.md", (r"^sdk/", r"(a)\1")) is True
+        assert _matches_any("docs/ab.md", (r"^sdk/", r"(a)\1")) is False
+        # Duplicate group names across patterns fall back the same way.
+        assert _matches_any("API/x", (r"(?P<n>^sdk/)", r"(?P<n>^api/)")) is True
+
     def test_load_policy_pack_default(self) -> None:
         from scripts.check_docs_contract import _load_policy_pack
 
@@ -582,6 +603,13 @@ class TestCheckApiSdkDrift:
         report = evaluate(["api/openapi.yaml", "docs/reference/api.md"])
         assert report.status == "ok"
 
+    def test_select_keeps_order_and_ignores_case(self) -> None:
+        from scripts.check_api_sdk_drift import _select
+
+        files = ["SDK/Client.ts", "docs/index.md", "service.proto", "sdk/a.ts"]
+        assert _select(files, (r"^sdk/", r"\.proto$")) == ["SDK/Client.ts", "service.proto", "sdk/a.ts"]
+        assert _select(files, ()) == []
+
 
 # ---------------------------------------------------------------------------
 # evaluate_kpi_sla
@@ -2,21 +2,30 @@
 
 from __future__ import annotations
 
+import json
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
 import pytest
 
+from scripts import seo_geo_optimizer
 from scripts.seo_geo_optimizer import (
     AlgoliaOptimizer,
+    AlgoliaRecordStream,
     ComprehensiveSEOOptimizer,
     GEOFinding,
+    ParsedDocCache,
     SEOEnhancer,
+    _init_worker,
+    _optimize_one,
+    _search_any,
     analyze_content,
     extract_frontmatter,
     geo_lint_file,
     get_first_paragraph,
     infer_metadata_from_path,
+    parse_document,
     seo_validate_file,
 )
 
@@ -82,6 +91,73 @@ class TestGetFirstParagraph:
         assert "Paragraph text." in result
 
 
+# ---------------------------------------------------------------------------
+# parse_document
+# ---------------------------------------------------------------------------
+
+
+class TestParseDocument:
+    """Tests for parse_document."""
+
+    def test_line_numbers_include_frontmatter(self) -> None:
+        doc = parse_document('---\ntitle: "T"\n---\n# Title\nIntro text.\n\n## Setup\n\nText.')
+        assert doc.frontmatter["title"] == "T"
+        assert doc.headings == [(4, 1, "Title"), (7, 2, "Setup")]
+        assert doc.main_heading == "Title"
+        assert doc.first_para == "Intro text."
+
+    def test_headings_inside_code_blocks_are_ignored(self) -> None:
+        doc = parse_document("# Title\n\n```bash\n# install\nnpm i\n```\n", has_frontmatter=False)
+        assert [h[2] for h in doc.headings] == ["Title"]
+        assert doc.code_block_ranges == [(3, 6)]
+        assert doc.sections == [{"heading": "Title", "content": "# install npm i ", "level": 1}]
+
+
+class TestParsedDocCache:
+    """Tests for ParsedDocCache."""
+
+    def test_reuses_stored_parse(self, tmp_path: Path) -> None:
+        cache = ParsedDocCache(tmp_path / "cache")
+        text = '---\ntitle: "T"\n---\n# Title\nBody.'
+        first = cache.parse(text)
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+        assert cache.parse(text) == first
+        assert ParsedDocCache(tmp_path / "cache").parse(text) == first
+
+    def test_skips_docs_that_do_not_round_trip(self, tmp_path: Path) -> None:
+        cache = ParsedDocCache(tmp_path / "cache")
+        text = '---\ntitle: "T"\nlast_reviewed: 2024-01-01\n---\n# Title\nBody.'
+        assert cache.parse(text).frontmatter["last_reviewed"] == date(2024, 1, 1)
+        assert not list((tmp_path / "cache").glob("*.json"))
+
+    def test_evicts_old_entries(self, tmp_path: Path) -> None:
+        import os
+
+        cache_dir = tmp_path / "cache"
+        ParsedDocCache(cache_dir).parse("# Title\n")
+        entry = next(cache_dir.glob("*.json"))
+        os.utime(entry, (0, 0))
+        ParsedDocCache(cache_dir).evict(max_age_days=1)
+        assert not entry.exists()
+
+
+class TestSearchAny:
+    """Tests for the combined rule-pattern search."""
+
+    def test_inline_global_flag_falls_back_to_per_pattern(self) -> None:
+        search = _search_any((r"\bexample\b", r"(?i)\bis\b"))
+        assert search("This IS a definition")
+        assert not search("No match here")
+
+    def test_backreference_keeps_its_own_group(self) -> None:
+        search = _search_any((r"(\d+)", r"(\w+) \1"))
+        assert search("it is is")
+        assert not search("it is not")
+
+    def test_empty_patterns_never_match(self) -> None:
+        assert not _search_any(())("anything")
+
+
 # ---------------------------------------------------------------------------
 # GEOFinding
 # ---------------------------------------------------------------------------
@@ -282,6 +358,18 @@ class TestSEOEnhancer:
         assert entry["priority"] == 0.9  # index page
         assert entry["changefreq"] in ("weekly", "monthly", "yearly")
 
+    def test_generate_sitemap_entry_uses_supplied_clock(self) -> None:
+        from datetime import date, datetime
+
+        enhancer = SEOEnhancer("https://docs.example.com")
+        now = datetime(2026, 3, 1, 12, 0)
+        fresh = enhancer.generate_sitemap_entry(Path("docs/a.md"), {"last_reviewed": "2026-02-20"}, now=now)
+        dated = enhancer.generate_sitemap_entry(Path("docs/b.md"), {"last_reviewed": date(2025, 1, 1)}, now=now)
+        undated = enhancer.generate_sitemap_entry(Path("docs/c.md"), {}, now=now)
+        assert fresh["changefreq"] == "weekly"
+        assert dated["changefreq"] == "yearly"
+        assert undated["lastmod"] == "2026-03-01"
+
     def test_breadcrumb_generation(self) -> None:
         enhancer = SEOEnhancer("https://docs.example.com")
         breadcrumb = enhancer._generate_breadcrumb(Path("docs/reference/nodes/webhook.md"))
@@ -333,6 +421,45 @@ class TestAlgoliaOptimizer:
         assert "objectID" in record
         assert record["content_type"] == "tutorial"
         assert record["heading"] == "Setup"
+        assert record["hierarchy"] == {"lvl0": "Documentation", "lvl1": "tutorial", "lvl2": "Setup"}
+
+    def test_create_search_record_strips_markdown(self) -> None:
+        optimizer = AlgoliaOptimizer()
+        section = {"heading": "Setup", "content": "Run **[the CLI](cli.md)** with `--fix` or *dry* mode.", "level": 2}
+        record = optimizer.create_search_record(Path("docs/test.md"), {}, section, 0)
+        assert record["content"] == "Run the CLI with --fix or dry mode."
+
+    def test_sink_receives_records_and_counts_types(self) -> None:
+        received: list[dict[str, Any]] = []
+        optimizer = AlgoliaOptimizer(sink=received.append)
+        optimizer.add_record({"objectID": "1", "content_type": "tutorial"})
+        optimizer.add_record({"objectID": "2", "content_type": "tutorial"})
+        assert optimizer.records == []
+        assert len(received) == 2
+        assert optimizer.record_count == 2
+        assert optimizer.content_type_counts == {"tutorial": 2}
+
+    def test_record_stream_matches_json_dump(self, tmp_path: Path) -> None:
+        records = [{"objectID": "1", "tags": ["a", "b"]}, {"objectID": "2", "tags": []}]
+        config = AlgoliaOptimizer().generate_algolia_config()
+        out = tmp_path / "algolia.json"
+        stream = AlgoliaRecordStream(out)
+        for record in records:
+            stream.write(record)
+        stream.close(config)
+        expected = json.dumps({"records": records, "config": config}, indent=2, default=str)
+        assert out.read_text() == expected
+        assert stream.count == 2
+
+    def test_record_stream_keeps_previous_payload_until_closed(self, tmp_path: Path) -> None:
+        out = tmp_path / "algolia.json"
+        out.write_text('{"records": []}')
+        stream = AlgoliaRecordStream(out)
+        stream.write({"objectID": "a"})
+        assert out.read_text() == '{"records": []}'
+        stream.close({})
+        assert json.loads(out.read_text())["records"] == [{"objectID": "a"}]
+        assert list(tmp_path.iterdir()) == [out]
 
     def test_generate_algolia_config(self) -> None:
         optimizer = AlgoliaOptimizer()
@@ -425,3 +552,46 @@ class TestComprehensiveSEOOptimizer:
         assert isinstance(results["geo_findings"], list)
         assert results["seo_data"] is not None
         assert len(results["search_records"]) >= 1
+
+    def test_generate_sitemap_reuses_parsed_frontmatter(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        md = _write_md(docs / "index.md", 'title: "Home"\nlast_reviewed: "2026-01-01"', "# Home\n\nWelcome.\n")
+        monkeypatch.chdir(tmp_path)
+        optimizer = ComprehensiveSEOOptimizer()
+        optimizer.optimize_file(Path("docs/index.md"))
+        md.write_text("---\nlast_reviewed: \"2020-01-01\"\n---\n# Changed\n", encoding="utf-8")
+        entries = optimizer.generate_sitemap("docs")
+        assert [e["lastmod"] for e in entries] == ["2026-01-01"]
+        assert (tmp_path / "sitemap.xml").exists()
+
+    def test_merge_results_matches_serial_run(self, tmp_path: Path) -> None:
+        md = _write_md(
+            tmp_path / "test.md",
+            'title: "Configure webhook endpoints"\ndescription: "Short"',
+            "# Configure webhook endpoints\n\n## Overview\n\nSet the path on port 5678.\n",
+        )
+        serial = ComprehensiveSEOOptimizer()
+        serial.optimize_file(md)
+        merged = ComprehensiveSEOOptimizer()
+        _init_worker(merged.base_url, None, merged._now)
+        merged.merge_results(md, *_optimize_one(md, False))
+        assert [str(f) for f in merged.findings] == [str(f) for f in serial.findings]
+        assert merged.algolia.records == serial.algolia.records
+        assert merged._fm_cache == serial._fm_cache
+
+    def test_worker_optimizer_is_reused_without_accumulating(self, tmp_path: Path) -> None:
+        first = _write_md(tmp_path / "a.md", 'title: "A"', "# A\n\nBody.\n")
+        second = _write_md(tmp_path / "b.md", 'title: "B"', "# B\n\nBody.\n")
+        now = datetime(2026, 1, 1)
+        _init_worker("https://docs.example.com", None, now)
+        worker = seo_geo_optimizer._worker_optimizer
+        _optimize_one(first, False)
+        results, enhanced, cached = _optimize_one(second, False)
+        assert seo_geo_optimizer._worker_optimizer is worker
+        assert worker._now == now
+        assert worker.findings == []
+        assert worker._fm_cache == {}
+        assert results["filepath"] == str(second)
+        assert enhanced == []
+        assert cached is not None
@@ -0,0 +1,121 @@
+"""Tests for scripts/upload_to_algolia.py."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from scripts import upload_to_algolia
+
+
+@pytest.fixture
+def captured_requests(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str, Any]]:
+    """Record Algolia calls instead of sending them."""
+    calls: list[tuple[str, str, Any]] = []
+
+    def fake_request(app_id: str, api_key: str, method: str, path: str, body: Any = None) -> dict:
+        calls.append((method, path, body))
+        return {"taskID": len(calls)}
+
+    monkeypatch.setattr(upload_to_algolia, "_algolia_request", fake_request)
+    monkeypatch.setenv("ALGOLIA_APP_ID", "app")
+    monkeypatch.setenv("ALGOLIA_API_KEY", "key")
+    monkeypatch.delenv("ALGOLIA_INDEX_NAME", raising=False)
+    return calls
+
+
+def _write_records(tmp_path: Path, count: int) -> Path:
+    records_file = tmp_path / "records.json"
+    records = [{"objectID": str(i), "title": f"Page {i}"} for i in range(count)]
+    records_file.write_text(json.dumps({"records": records, "config": {}}), encoding="utf-8")
+    return records_file
+
+
+class TestMain:
+    """Tests for the upload flow."""
+
+    def test_uploads_all_batches_in_order(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        capsys: pytest.CaptureFixture[str],
+        captured_requests: list[tuple[str, str, Any]],
+    ) -> None:
+        records_file = _write_records(tmp_path, 5)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["upload_to_algolia.py", "--records-file", str(records_file), "--batch-size", "2"],
+        )
+
+        assert upload_to_algolia.main() == 0
+
+        assert captured_requests[0][:2] == ("POST", "/1/indexes/docs/clear")
+        batches = [json.loads(body) for method, path, body in captured_requests if path.endswith("/batch")]
+        uploaded = [req["body"]["objectID"] for batch in batches for req in batch["requests"]]
+        assert sorted(uploaded, key=int) == ["0", "1", "2", "3", "4"]
+        # Batches may be sent in any order, but results are reported in batch order.
+        output = capsys.readouterr().out.splitlines()
+        reported = [line.split(" (")[0] for line in output if line.startswith("Batch")]
+        assert reported == ["Batch 1: 2 records", "Batch 2: 2 records", "Batch 3: 1 records"]
+
+    def test_failed_batch_stops_the_upload(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        captured_requests: list[tuple[str, str, Any]],
+    ) -> None:
+        def failing_request(app_id: str, api_key: str, method: str, path: str, body: Any = None) -> dict:
+            captured_requests.append((method, path, body))
+            raise OSError("batch rejected")
+
+        monkeypatch.setattr(upload_to_algolia, "_algolia_request", failing_request)
+        records_file = _write_records(tmp_path, 5)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            [
+                "upload_to_algolia.py",
+                "--records-file",
+                str(records_file),
+                "--batch-size",
+                "1",
+                "--concurrency",
+                "1",
+                "--no-clear",
+            ],
+        )
+
+        with pytest.raises(OSError):
+            upload_to_algolia.main()
+
+        assert len(captured_requests) == 1
+
+    def test_no_clear_keeps_existing_records(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        captured_requests: list[tuple[str, str, Any]],
+    ) -> None:
+        records_file = _write_records(tmp_path, 1)
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["upload_to_algolia.py", "--records-file", str(records_file), "--no-clear"],
+        )
+
+        assert upload_to_algolia.main() == 0
+
+        assert all(not path.endswith("/clear") for _, path, _ in captured_requests)
+        assert len(captured_requests) == 1
+
+    def test_skips_without_credentials(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("ALGOLIA_APP_ID", raising=False)
+        monkeypatch.delenv("ALGOLIA_API_KEY", raising=False)
+        monkeypatch.setattr(sys, "argv", ["upload_to_algolia.py"])
+
+        assert upload_to_algolia.main() == 0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import tempfile
 from pathlib import Path
 from typing import Any
@@ -10,12 +11,18 @@ import pytest
 import yaml
 
 from scripts.validate_frontmatter import (
+    CompiledRule,
+    _compile_rule,
+    _compiled_schema,
     _is_type,
     _normalize_string_candidate,
+    _read_frontmatter_block,
     _type_matches,
+    _validate_docs_file,
     _validate_node,
     extract_frontmatter,
     load_schema,
+    main,
     validate_file,
 )
 
@@ -62,6 +69,31 @@ class TestExtractFrontmatter:
         assert "last_reviewed" in result
 
 
+class TestReadFrontmatterBlock:
+    """Tests for _read_frontmatter_block."""
+
+    def test_stops_at_closing_delimiter(self, tmp_path: Path) -> None:
+        md = tmp_path / "page.md"
+        md.write_text("---\ntitle: Hello\n---\n# Body\n" + "x" * 50_000, encoding="utf-8")
+        assert _read_frontmatter_block(md) == b"\ntitle: Hello\n"
+
+    def test_delimiter_across_chunks(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("scripts.validate_frontmatter._FRONTMATTER_READ_CHUNK", 4)
+        md = tmp_path / "page.md"
+        md.write_text("---\ntitle: Hello\n---\nbody", encoding="utf-8")
+        assert _read_frontmatter_block(md) == b"\ntitle: Hello\n"
+
+    def test_returns_none_without_frontmatter(self, tmp_path: Path) -> None:
+        md = tmp_path / "page.md"
+        md.write_text("# Title\n---\n", encoding="utf-8")
+        assert _read_frontmatter_block(md) is None
+
+    def test_returns_none_when_unclosed(self, tmp_path: Path) -> None:
+        md = tmp_path / "page.md"
+        md.write_text("---\ntitle: Hello\n", encoding="utf-8")
+        assert _read_frontmatter_block(md) is None
+
+
 # ---------------------------------------------------------------------------
 # _normalize_string_candidate
 # ---------------------------------------------------------------------------
@@ -222,6 +254,12 @@ class TestValidateNode:
         assert len(errors) == 1
         assert "unique items" in errors[0]
 
+    def test_array_unique_items_compares_string_forms(self) -> None:
+        """Items are compared by str(), so 1 and "1" are duplicates; reported once."""
+        errors = _validate_node([1, "1", "a", "a"], {"type": "array", "uniqueItems": True}, "root")
+        assert errors == ["root: must contain unique items"]
+        assert _validate_node(["a", "b"], {"type": "array", "uniqueItems": True}, "root") == []
+
     def test_array_item_schema(self) -> None:
         errors = _validate_node(
             ["ok", 42],
@@ -240,6 +278,28 @@ class TestValidateNode:
         assert len(errors) == 1
         assert "missing required field" in errors[0]
 
+    def test_enum_with_unhashable_value(self) -> None:
+        """List values are reported as invalid instead of raising on frozenset lookup."""
+        errors = _validate_node(["a"], {"enum": ["a", "b"]}, "root")
+        assert len(errors) == 1
+        assert "invalid value" in errors[0]
+
+    def test_accepts_compiled_rule(self) -> None:
+        rule = _compile_rule({"type": ["string", "null"], "pattern": "^[a-z]+$"})
+        assert isinstance(rule, CompiledRule)
+        assert rule.pattern_re is not None and rule.pattern_re.pattern == "^[a-z]+$"
+        assert _validate_node(None, rule, "root") == []
+        assert "does not match pattern" in _validate_node("ABC", rule, "root")[0]
+
+    def test_type_list_without_names_rejects_everything(self) -> None:
+        """A type list with no string entries matches nothing, as _type_matches does."""
+        assert _validate_node("x", {"type": [1, 2]}, "root") == ["root: must be of type '[1, 2]'"]
+        assert _validate_node("x", {"type": 7}, "root") == []
+
+    def test_union_type_error_message(self) -> None:
+        errors = _validate_node(42, {"type": ["string", "null"]}, "root")
+        assert errors == ["root: must be of type '['string', 'null']'"]
+
     def test_object_properties_validated(self) -> None:
         schema: dict[str, Any] = {
             "type": "object",
@@ -291,6 +351,16 @@ class TestValidateFile:
         errors = validate_file(md, {"required": ["title", "description"]})
         assert any("missing required field 'description'" in e for e in errors)
 
+    def test_missing_required_fields_reported_in_schema_order(self, tmp_path: Path) -> None:
+        md = tmp_path / "missing.md"
+        md.write_text("---\ntitle: Hello\n---\n# Body\n", encoding="utf-8")
+        errors = validate_file(md, {"required": ["owner", "title", "description", "audience"]})
+        assert errors == [
+            f"{md}: missing required field 'owner'",
+            f"{md}: missing required field 'description'",
+            f"{md}: missing required field 'audience'",
+        ]
+
     def test_property_validation(self, tmp_path: Path) -> None:
         """Property rules are applied to present fields."""
         md = tmp_path / "prop.md"
@@ -370,6 +440,26 @@ class TestValidateFile:
         assert not any("required when status is 'removed'" in e for e in errors)
         assert not any("noindex: true is required" in e for e in errors)
 
+    def test_docs_file_check_includes_i18n(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The per-file worker combines schema and i18n errors."""
+        (tmp_path / "docs-schema.yml").write_text(
+            yaml.dump({"required": ["title"], "properties": {"title": {"type": "string"}}}),
+            encoding="utf-8",
+        )
+        docs = tmp_path / "docs" / "de"
+        docs.mkdir(parents=True)
+        md = docs / "page.md"
+        md.write_text("---\nlanguage: fr\n---\n# Body\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        _compiled_schema.cache_clear()
+        try:
+            errors, cacheable = _validate_docs_file(md, tmp_path / "docs")
+        finally:
+            _compiled_schema.cache_clear()
+        assert cacheable is True
+        assert any("missing required field 'title'" in e for e in errors)
+        assert any("does not match folder locale 'de'" in e for e in errors)
+
 
 # ---------------------------------------------------------------------------
 # load_schema
@@ -390,6 +480,25 @@ class TestLoadSchema:
         result = load_schema("schema.yml")
         assert "required" in result
 
+    def test_compiled_schema_is_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The compiled schema is built once and reused across validations."""
+        schema_file = tmp_path / "schema.yml"
+        schema_file.write_text(
+            yaml.dump({"required": ["title"], "properties": {"title": {"type": "string", "minLength": 3}}}),
+            encoding="utf-8",
+        )
+        monkeypatch.chdir(tmp_path)
+        _compiled_schema.cache_clear()
+        try:
+            compiled = _compiled_schema("schema.yml")
+            assert _compiled_schema("schema.yml") is compiled
+            assert compiled.required == ("title",)
+            md = tmp_path / "short.md"
+            md.write_text("---\ntitle: X\n---\n# Body\n", encoding="utf-8")
+            assert validate_file(md, compiled) == validate_file(md, load_schema("schema.yml"))
+        finally:
+            _compiled_schema.cache_clear()
+
     def test_raises_on_non_dict(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
         """Raises ValueError when schema YAML is not a mapping."""
         schema_file = tmp_path / "bad.yml"
@@ -397,3 +506,109 @@ class TestLoadSchema:
         monkeypatch.chdir(tmp_path)
         with pytest.raises(ValueError, match="must be a mapping"):
             load_schema("bad.yml")
+
+
+# ---------------------------------------------------------------------------
+# main (validation cache)
+# ---------------------------------------------------------------------------
+
+
+class TestValidationCache:
+    """Tests for the mtime/size keyed validation cache used by main."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_schema_cache(self) -> Any:
+        _compiled_schema.cache_clear()
+        yield
+        _compiled_schema.cache_clear()
+
+    @staticmethod
+    def _setup(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        (tmp_path / "docs-schema.yml").write_text(
+            yaml.dump({"required": ["title"], "properties": {"title": {"type": "string"}}}),
+            encoding="utf-8",
+        )
+        (tmp_path / "docs").mkdir()
+        md = tmp_path / "docs" / "page.md"
+        md.write_text("---\ntitle: Hello\n---\n# Body\n", encoding="utf-8")
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("FRONTMATTER_CACHE", raising=False)
+        monkeypatch.delenv("PRE_COMMIT", raising=False)
+        return md
+
+    @staticmethod
+    def _poison_cache(tmp_path: Path) -> None:
+        cache_file = tmp_path / ".cache" / "frontmatter.json"
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        data["files"]["docs/page.md"]["errors"] = ["cached error"]
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+    def test_unchanged_file_reuses_cached_result(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        self._setup(tmp_path, monkeypatch)
+        main()
+        self._poison_cache(tmp_path)
+
+        with pytest.raises(SystemExit):
+            main()
+        assert "cached error" in capsys.readouterr().err
+
+    def test_modified_file_is_revalidated(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        md = self._setup(tmp_path, monkeypatch)
+        main()
+        md.write_text("---\ndescription: no title here\n---\n# Body\n", encoding="utf-8")
+
+        with pytest.raises(SystemExit):
+            main()
+        assert "missing required field 'title'" in capsys.readouterr().err
+
+    def test_schema_change_invalidates_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        self._setup(tmp_path, monkeypatch)
+        main()
+        (tmp_path / "docs-schema.yml").write_text(
+            yaml.dump({"required": ["title", "owner"], "properties": {}}),
+            encoding="utf-8",
+        )
+        _compiled_schema.cache_clear()
+
+        with pytest.raises(SystemExit):
+            main()
+        assert "missing required field 'owner'" in capsys.readouterr().err
+
+    def test_schema_change_discards_cached_results(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        self._setup(tmp_path, monkeypatch)
+        main()
+        self._poison_cache(tmp_path)
+        (tmp_path / "docs-schema.yml").write_text(yaml.dump({"required": ["title"]}), encoding="utf-8")
+        _compiled_schema.cache_clear()
+
+        main()
+        assert "all files pass" in capsys.readouterr().out
+
+    def test_validator_change_discards_cached_results(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        self._setup(tmp_path, monkeypatch)
+        main()
+        self._poison_cache(tmp_path)
+        monkeypatch.setattr("scripts.validate_frontmatter._validator_digest", lambda: b"changed")
+
+        main()
+        assert "all files pass" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(("name", "value"), [("FRONTMATTER_CACHE", "0"), ("PRE_COMMIT", "1")])
+    def test_cache_can_be_disabled(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, name: str, value: str
+    ) -> None:
+        self._setup(tmp_path, monkeypatch)
+        monkeypatch.setenv(name, value)
+
+        main()
+        assert not (tmp_path / ".cache").exists()